@@ -0,0 +1,7 @@
+from fastapi import Request
+
+from app.cache.reference import ReferenceCache
+
+
+def get_reference_cache(request: Request) -> ReferenceCache:
+    return request.app.state.reference
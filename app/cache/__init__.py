@@ -0,0 +1,16 @@
+from app.cache.redis import get_redis
+from app.cache.catalog import CatalogCache, catalog_cache
+from app.cache.middleware import ResponseCacheMiddleware, cache_response, index_cached_routes
+from app.cache.rbac import get_user_permissions, invalidate_all_permissions, invalidate_user_permissions
+
+__all__ = [
+    "get_redis",
+    "ResponseCacheMiddleware",
+    "cache_response",
+    "index_cached_routes",
+    "get_user_permissions",
+    "invalidate_all_permissions",
+    "invalidate_user_permissions",
+    "CatalogCache",
+    "catalog_cache",
+]
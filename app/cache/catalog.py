@@ -0,0 +1,69 @@
+import time
+from typing import Any, Hashable
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.testing.test_catalog_model import Test, TestCategory, TestDetails, TestPanel
+
+# TestDetails is included so snapshots may carry detail columns without
+# going stale
+_CATALOG_MODELS = (Test, TestCategory, TestDetails, TestPanel)
+
+
+class CatalogCache:
+    """
+    Per-process TTL cache for the global test catalog (tests, details, categories,
+    panels). Holds immutable snapshots only - never session-bound ORM objects,
+    since entries are shared by every request in the process. Entries expire
+    after `ttl` seconds and the whole cache is cleared when this process
+    commits a write to a catalog table; writes from other workers become
+    visible once the TTL runs out.
+    """
+
+    def __init__(self, ttl: float = settings.CACHE_DEFAULT_TTL, maxsize: int = 10_000) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            self._entries.pop(key, None)
+            return default
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if len(self._entries) >= self.maxsize:
+            # Oldest insertion first; good enough for near-static data
+            self._entries.pop(next(iter(self._entries)), None)
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+catalog_cache = CatalogCache()
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_catalog_changes(session: Session, flush_context) -> None:
+    # Only note the write here; clearing at flush time would let a rolled-back
+    # transaction (or a concurrent reader of uncommitted state) repopulate it
+    if any(isinstance(obj, _CATALOG_MODELS) for obj in (*session.new, *session.dirty, *session.deleted)):
+        session.info["catalog_changed"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _clear_catalog_on_commit(session: Session) -> None:
+    if session.info.pop("catalog_changed", False):
+        catalog_cache.clear()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_catalog_changes(session: Session) -> None:
+    session.info.pop("catalog_changed", None)
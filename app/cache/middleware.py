@@ -0,0 +1,131 @@
+import json
+from typing import Callable, Optional, Sequence
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from starlette.routing import BaseRoute, Match, Route
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+CACHE_TTL_ATTR = "__response_cache_ttl__"
+CACHE_VARY_ATTR = "__response_cache_vary__"
+
+# Recomputed on replay, or meaningless for a replayed body
+_UNSTORED_HEADERS = frozenset({b"content-length", b"transfer-encoding", b"connection", b"date", b"server"})
+
+
+def cache_response(ttl: Optional[int] = None, vary: Sequence[str] = ()) -> Callable:
+    """Mark a GET endpoint as cacheable by ResponseCacheMiddleware.
+
+    The cache key is the path and query string plus the request headers named
+    in ``vary`` - nothing else about the caller. Routes whose response depends
+    on the tenant or the user MUST list the headers that identify them (e.g.
+    ``vary=("authorization",)``) or not be cached at all. ``ttl=None`` uses
+    CACHE_DEFAULT_TTL.
+    """
+    def decorator(endpoint: Callable) -> Callable:
+        setattr(endpoint, CACHE_TTL_ATTR, ttl)
+        setattr(endpoint, CACHE_VARY_ATTR, tuple(h.lower().encode("latin-1") for h in vary))
+        return endpoint
+    return decorator
+
+
+def index_cached_routes(routes: list[BaseRoute], default_ttl: int) -> list[tuple[Route, int, tuple[bytes, ...]]]:
+    """Collect the GET routes marked with @cache_response, resolved to (route, ttl, vary)."""
+    indexed = []
+    for route in routes:
+        if not isinstance(route, Route) or "GET" not in (route.methods or ()):
+            continue
+        if not hasattr(route.endpoint, CACHE_TTL_ATTR):
+            continue
+        ttl = getattr(route.endpoint, CACHE_TTL_ATTR)
+        vary = getattr(route.endpoint, CACHE_VARY_ATTR, ())
+        indexed.append((route, default_ttl if ttl is None else ttl, vary))
+    return indexed
+
+
+class ResponseCacheMiddleware:
+    """
+    Serve cacheable GET responses from Redis as pre-encoded bytes.
+
+    Routes are indexed once at startup (``app.state.cached_routes``), so a
+    cache hit skips routing, dependency resolution and JSON encoding. The
+    handler's headers are stored with the body and replayed unchanged. Redis
+    errors fail open - the request falls through to the handler.
+    """
+
+    def __init__(self, app: ASGIApp, redis: Redis, key_prefix: str) -> None:
+        self.app = app
+        self.redis = redis
+        self.key_prefix = f"{key_prefix}response:"
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        matched = self._match(scope)
+        if matched is None:
+            await self.app(scope, receive, send)
+            return
+        ttl, vary = matched
+
+        key = self.key_prefix + scope["path"]
+        if scope["query_string"]:
+            key += "?" + scope["query_string"].decode("latin-1")
+        if vary:
+            request_headers = dict(scope["headers"])
+            key += "|" + "|".join(request_headers.get(name, b"").decode("latin-1") for name in vary)
+
+        try:
+            cached = await self.redis.hgetall(key)
+        except RedisError:
+            await self.app(scope, receive, send)
+            return
+
+        # Entries written before headers were stored lack the field; refill them
+        if cached and b"headers" in cached:
+            body = cached[b"body"]
+            headers = [(k.encode("latin-1"), v.encode("latin-1")) for k, v in json.loads(cached[b"headers"])]
+            headers.append((b"content-length", str(len(body)).encode("latin-1")))
+            await send({"type": "http.response.start", "status": 200, "headers": headers})
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        await self._call_and_store(scope, receive, send, key, ttl)
+
+    def _match(self, scope: Scope) -> Optional[tuple[int, tuple[bytes, ...]]]:
+        cached_routes = getattr(scope["app"].state, "cached_routes", ())
+        for route, ttl, vary in cached_routes:
+            match, _ = route.matches(scope)
+            if match == Match.FULL:
+                return ttl, vary
+        return None
+
+    async def _call_and_store(self, scope: Scope, receive: Receive, send: Send, key: str, ttl: int) -> None:
+        start: dict = {}
+        chunks: list[bytes] = []
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                start.update(message)
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+        if start.get("status") != 200:
+            return
+        raw_headers = [(k.lower(), v) for k, v in start.get("headers", [])]
+        headers = dict(raw_headers)
+        if b"set-cookie" in headers or b"no-store" in headers.get(b"cache-control", b""):
+            return
+
+        stored = [(k.decode("latin-1"), v.decode("latin-1")) for k, v in raw_headers if k not in _UNSTORED_HEADERS]
+        try:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.hset(key, mapping={"headers": json.dumps(stored), "body": b"".join(chunks)})
+                pipe.expire(key, ttl)
+                await pipe.execute()
+        except RedisError:
+            pass
@@ -0,0 +1,130 @@
+import asyncio
+import json
+import logging
+from typing import Optional
+from uuid import UUID
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy import event, inspect, lambda_stmt, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
+
+from app.cache.redis import get_redis
+from app.core.config import settings
+from app.models.staff.rbac_model import Permission, Role, role_permissions, user_roles
+from app.models.staff.user_model import User
+
+logger = logging.getLogger(__name__)
+
+PERMISSIONS_KEY_PREFIX = f"{settings.CACHE_KEY_PREFIX}rbac:perms:"
+
+# Keeps fire-and-forget invalidation tasks alive until they finish
+_pending: set[asyncio.Task] = set()
+
+
+def _permissions_key(user_id: UUID) -> str:
+    return f"{PERMISSIONS_KEY_PREFIX}{user_id}"
+
+
+def _permission_names_stmt(user_id: UUID) -> StatementLambdaElement:
+    # Built and compiled once per process; user_id is extracted as a bound
+    # parameter on each call instead of reconstructing the Select.
+    return lambda_stmt(
+        lambda: select(Permission.name)
+        .join(role_permissions, role_permissions.c.permission_id == Permission.id)
+        .join(Role, Role.id == role_permissions.c.role_id)
+        .join(user_roles, user_roles.c.role_id == Role.id)
+        .where(user_roles.c.user_id == user_id, Role.is_active.is_(True), Permission.is_active.is_(True))
+    )
+
+
+async def get_user_permissions(db: AsyncSession, user_id: UUID, redis: Optional[Redis] = None) -> frozenset[str]:
+    """
+    Names of every active permission granted to the user through an active role.
+    Served from Redis for CACHE_DEFAULT_TTL seconds; falls back to the database
+    when Redis is unavailable.
+    """
+    redis = redis or get_redis()
+    key = _permissions_key(user_id)
+    try:
+        cached = await redis.get(key)
+    except RedisError:
+        cached = None
+    if cached is not None:
+        return frozenset(json.loads(cached))
+
+    names = frozenset((await db.scalars(_permission_names_stmt(user_id))).all())
+
+    try:
+        await redis.set(key, json.dumps(sorted(names)), ex=settings.CACHE_DEFAULT_TTL)
+    except RedisError:
+        pass
+    return names
+
+
+async def invalidate_user_permissions(*user_ids: UUID, redis: Optional[Redis] = None) -> None:
+    if user_ids:
+        await (redis or get_redis()).delete(*(_permissions_key(u) for u in user_ids))
+
+
+async def invalidate_all_permissions(redis: Optional[Redis] = None) -> None:
+    redis = redis or get_redis()
+    keys = [key async for key in redis.scan_iter(match=f"{PERMISSIONS_KEY_PREFIX}*", count=500)]
+    if keys:
+        await redis.delete(*keys)
+
+
+async def _invalidate(user_ids: set[UUID], everything: bool) -> None:
+    if everything:
+        await invalidate_all_permissions()
+    else:
+        await invalidate_user_permissions(*user_ids)
+
+
+def _invalidation_done(task: asyncio.Task) -> None:
+    _pending.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error(
+            "Permission cache invalidation failed; stale entries expire within %ss",
+            settings.CACHE_DEFAULT_TTL,
+            exc_info=task.exception(),
+        )
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_rbac_changes(session: Session, flush_context) -> None:
+    """Record which cached permission sets the flush made stale.
+
+    Role/Permission edits can affect any user, so they clear everything; a
+    change to a user's own roles collection only clears that user. Core-level
+    writes to user_roles/role_permissions bypass this hook and must call the
+    invalidate_* helpers themselves.
+    """
+    pending = session.info.setdefault("rbac_invalidate", {"users": set(), "all": False})
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, (Role, Permission)):
+            pending["all"] = True
+        elif isinstance(obj, User):
+            if obj in session.deleted or inspect(obj).attrs.roles.history.has_changes():
+                pending["users"].add(obj.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _flush_rbac_invalidations(session: Session) -> None:
+    pending = session.info.pop("rbac_invalidate", None)
+    if not pending or not (pending["all"] or pending["users"]):
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return  # sync session outside the app (scripts); TTL expiry covers it
+    task = loop.create_task(_invalidate(pending["users"], pending["all"]))
+    _pending.add(task)
+    task.add_done_callback(_invalidation_done)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rbac_invalidations(session: Session) -> None:
+    session.info.pop("rbac_invalidate", None)
@@ -0,0 +1,11 @@
+from functools import lru_cache
+
+from redis.asyncio import Redis
+
+from app.core.config import settings
+
+
+@lru_cache(maxsize=1)
+def get_redis() -> Redis:
+    """Shared async Redis client (connection-pooled, created on first use)."""
+    return Redis.from_url(settings.REDIS_URL)
@@ -0,0 +1,106 @@
+import asyncio
+import logging
+from collections import namedtuple
+from typing import Any, Optional
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy import inspect, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.session import AsyncSessionLocal
+from app.models.core.department_model import Specialization
+from app.models.core.laboratory_model import Laboratory
+
+logger = logging.getLogger(__name__)
+
+REFERENCE_CHANNEL = f"{settings.CACHE_KEY_PREFIX}reference:invalidate"
+
+
+def _snapshot_type(model: type) -> type:
+    """Immutable row type with one field per mapped column of `model`."""
+    return namedtuple(f"{model.__name__}Ref", [attr.key for attr in inspect(model).column_attrs])
+
+
+# The cache is shared by every request in the process, so it holds plain
+# column snapshots - never ORM instances bound to whichever session loaded them
+SpecializationRef = _snapshot_type(Specialization)
+LaboratoryRef = _snapshot_type(Laboratory)
+
+
+def _columns(snapshot_type: type, model: type) -> tuple[Any, ...]:
+    return tuple(getattr(model, name) for name in snapshot_type._fields)
+
+
+class ReferenceCache:
+    """
+    In-process copy of rarely-changing reference rows: all specializations and
+    the active laboratories. Loaded once at startup and reloaded whenever a
+    message arrives on REFERENCE_CHANNEL; lookups fall back to the DB on a miss.
+    """
+
+    def __init__(self) -> None:
+        self.specializations_by_id: dict[int, SpecializationRef] = {}
+        self.labs_by_slug: dict[str, LaboratoryRef] = {}
+
+    async def load(self) -> None:
+        try:
+            async with AsyncSessionLocal() as db:
+                specializations = [
+                    SpecializationRef(*row)
+                    for row in await db.execute(select(*_columns(SpecializationRef, Specialization)))
+                ]
+                labs = [
+                    LaboratoryRef(*row)
+                    for row in await db.execute(
+                        select(*_columns(LaboratoryRef, Laboratory)).where(Laboratory.is_active.is_(True))
+                    )
+                ]
+        except (SQLAlchemyError, OSError):
+            logger.exception("Could not load reference data; serving from the database until the next reload")
+            return
+        # Swap whole dicts so readers never see a half-built cache
+        self.specializations_by_id = {s.id: s for s in specializations}
+        self.labs_by_slug = {lab.slug: lab for lab in labs}
+
+    async def get_specialization(self, db: AsyncSession, specialization_id: int) -> Optional[SpecializationRef]:
+        specialization = self.specializations_by_id.get(specialization_id)
+        if specialization is None:
+            row = (await db.execute(
+                select(*_columns(SpecializationRef, Specialization)).where(Specialization.id == specialization_id)
+            )).first()
+            if row is not None:
+                specialization = self.specializations_by_id[specialization_id] = SpecializationRef(*row)
+        return specialization
+
+    async def get_laboratory(self, db: AsyncSession, slug: str) -> Optional[LaboratoryRef]:
+        lab = self.labs_by_slug.get(slug)
+        if lab is None:
+            row = (await db.execute(
+                select(*_columns(LaboratoryRef, Laboratory))
+                .where(Laboratory.slug == slug, Laboratory.is_active.is_(True))
+            )).first()
+            if row is not None:
+                lab = self.labs_by_slug[slug] = LaboratoryRef(*row)
+        return lab
+
+    async def listen(self, redis: Redis, retry_seconds: float = 5.0) -> None:
+        """Reload on every invalidation message; runs until cancelled."""
+        while True:
+            try:
+                async with redis.pubsub() as pubsub:
+                    await pubsub.subscribe(REFERENCE_CHANNEL)
+                    async for message in pubsub.listen():
+                        if message["type"] == "message":
+                            await self.load()
+            except RedisError:
+                logger.warning("Reference cache subscription lost; retrying in %ss", retry_seconds)
+                await asyncio.sleep(retry_seconds)
+
+
+async def publish_reference_change(redis: Redis) -> None:
+    """Tell every worker to reload reference data. Call after committing a
+    write to specializations or laboratories."""
+    await redis.publish(REFERENCE_CHANNEL, b"reload")
@@ -1,9 +1,19 @@
-from pydantic import EmailStr, field_validator
-from pydantic_settings import BaseSettings
 import json
+import os
+import re
+from dataclasses import MISSING, dataclass, fields
+from functools import lru_cache
 
+from dotenv import dotenv_values
 
-class Settings(BaseSettings):
+
+_EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+_TRUE_VALUES = frozenset({"1", "true", "yes", "on"})
+_FALSE_VALUES = frozenset({"0", "false", "no", "off"})
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
 
     ENVIRONMENT: str
     DATABASE_URL: str
@@ -18,6 +28,7 @@ class Settings(BaseSettings):
     MAX_LOGIN_ATTEMPTS: int
     LOGIN_ATTEMPT_WINDOW_MINUTES: int
     ALGORITHM: str
+    # JSON-encoded in the env file
     CORS_ORIGINS: list[str]
 
     # project details
@@ -33,9 +44,9 @@ class Settings(BaseSettings):
     # email
     SMTP_HOST: str
     SMTP_PORT: int
-    SMTP_USER: EmailStr
+    SMTP_USER: str
     SMTP_PASSWORD: str
-    FROM_EMAIL: EmailStr
+    FROM_EMAIL: str
     FROM_NAME: str
 
     # sms
@@ -56,16 +67,56 @@ class Settings(BaseSettings):
     # system settings
     SYSTEM_STATUS: str = "up"
 
-    @field_validator('CORS_ORIGINS', mode='before')
-    @classmethod
-    def parse_cors_origins(cls, v):
-        if isinstance(v, str):
-            return json.loads(v)
-        return v
+    # server (run_app.py); WORKERS=0 means one per CPU outside development
+    HOST: str = "127.0.0.1"
+    PORT: int = 8000
+    WORKERS: int = 0
+
+
+_EMAIL_FIELDS = ("SMTP_USER", "FROM_EMAIL")
+
+
+def _coerce(name: str, field_type, raw: str):
+    if field_type is bool:
+        value = raw.strip().lower()
+        if value in _TRUE_VALUES:
+            return True
+        if value in _FALSE_VALUES:
+            return False
+        # A typo must not silently read as False
+        raise ValueError(f"{name} must be one of {sorted(_TRUE_VALUES | _FALSE_VALUES)}, got {raw!r}")
+    if field_type is int:
+        return int(raw)
+    if field_type == list[str]:
+        return json.loads(raw)
+    return raw
+
+
+def load_settings(env_file: str = ".env") -> Settings:
+    """Build Settings from the env file, with process env vars taking priority."""
+    env = {k: v for k, v in dotenv_values(env_file, encoding="utf-8").items() if v is not None}
+    env.update(os.environ)
+
+    values = {}
+    missing = []
+    for field in fields(Settings):
+        if field.name in env:
+            values[field.name] = _coerce(field.name, field.type, env[field.name])
+        elif field.default is MISSING:
+            missing.append(field.name)
+    if missing:
+        raise ValueError(f"Missing required settings: {', '.join(missing)}")
+
+    for name in _EMAIL_FIELDS:
+        if not _EMAIL_RE.fullmatch(values[name]):
+            raise ValueError(f"{name} must be a valid email address")
+
+    return Settings(**values)
+
 
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    return load_settings()
 
 
-settings = Settings()
\ No newline at end of file
+settings = get_settings()
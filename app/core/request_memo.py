@@ -0,0 +1,36 @@
+from contextvars import ContextVar
+from typing import Any, Optional
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+_memo: ContextVar[Optional[dict[str, dict[Any, Any]]]] = ContextVar("request_memo", default=None)
+
+
+def request_memo(namespace: str) -> dict:
+    """
+    Dict shared by everything serving the current request, one per namespace.
+    Outside RequestMemoMiddleware (scripts, background tasks) each call gets a
+    throwaway dict, so callers never see stale entries.
+    """
+    memo = _memo.get()
+    if memo is None:
+        return {}
+    return memo.setdefault(namespace, {})
+
+
+class RequestMemoMiddleware:
+    """Give each HTTP request a fresh request_memo() store, dropped when it ends."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = _memo.set({})
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _memo.reset(token)
@@ -1,4 +1,4 @@
-from app.db.base import Base
-from app.db.session import AsyncSessionLocal, engine, get_db
+from app.db.base import Base, uuid7
+from app.db.session import AsyncSessionLocal, engine, get_db, set_tenant
 
-__all__ = ["Base", "AsyncSessionLocal", "engine", "get_db"]
\ No newline at end of file
+__all__ = ["Base", "uuid7", "AsyncSessionLocal", "engine", "get_db", "set_tenant"]
\ No newline at end of file
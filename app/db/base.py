@@ -1,2 +1,24 @@
+import os
+import time
+from uuid import UUID
+
 from sqlalchemy.orm import declarative_base
-Base = declarative_base()
\ No newline at end of file
+
+Base = declarative_base()
+
+
+def uuid7() -> UUID:
+    """
+    Time-ordered UUID (RFC 9562 version 7): 48-bit Unix ms timestamp followed
+    by random bits, so new primary keys land on the right edge of the B-tree.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    value = (
+        (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76
+        | (rand >> 62 & 0xFFF) << 64
+        | 0b10 << 62
+        | rand & 0x3FFF_FFFF_FFFF_FFFF
+    )
+    return UUID(int=value)
@@ -1,14 +1,32 @@
+from sqlalchemy import event, func, or_, select
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from sqlalchemy.orm import ORMExecuteState, Session, with_loader_criteria
 from app.core.config import settings
 
 # Create async engine
+# Connections are pinged at checkout (a cheap round-trip that catches ones the
+# server or a proxy dropped) and recycled every 30 minutes. The repeated
+# tenant-filter shapes (laboratory_id = $1 AND is_active = $2 ...) stay
+# prepared server-side via asyncpg's statement cache, so they aren't re-parsed
+# and re-planned on each call. A larger compiled-statement cache keeps every
+# distinct ORM query shape compiled once per process, and bulk inserts are sent
+# as multi-row VALUES batches of up to 1000 rows. JIT is off for the session:
+# these are short OLTP lookups where LLVM compile time exceeds the query itself.
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.ENVIRONMENT == "development",
     future=True,
+    query_cache_size=2000,
+    insertmanyvalues_page_size=1000,
     pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
+    pool_recycle=1800,
+    pool_size=20,
+    max_overflow=40,
+    connect_args={
+        "prepared_statement_cache_size": 500,
+        "statement_cache_size": 500,
+        "server_settings": {"jit": "off"},
+    },
 )
 
 # Create async session factory
@@ -26,4 +44,63 @@ async def get_db():
         try:
             yield session
         finally:
-            await session.close()
\ No newline at end of file
+            await session.close()
+
+
+def set_tenant(session: AsyncSession, laboratory_id: int) -> None:
+    """Scope every ORM SELECT on this session to one laboratory."""
+    session.info["laboratory_id"] = laboratory_id
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _add_tenant_criteria(execute_state: ORMExecuteState) -> None:
+    # Adds laboratory_id = :lab to every tenant-owned entity in the statement
+    # (including relationship loads), so the planner always sees the tenant
+    # equality that leads the idx_*_lab_* indexes. Bypass for cross-tenant
+    # work with .execution_options(all_tenants=True).
+    laboratory_id = execute_state.session.info.get("laboratory_id")
+    if (
+        laboratory_id is None
+        or not execute_state.is_select
+        or execute_state.execution_options.get("all_tenants", False)
+    ):
+        return
+
+    from app.models import (
+        Branch, BranchTestCapability, CorporateDiscount, DiscountTier, TestPrice, User,
+    )
+
+    execute_state.statement = execute_state.statement.options(
+        *(
+            with_loader_criteria(model, lambda cls: cls.laboratory_id == laboratory_id, include_aliases=True)
+            for model in (User, Branch, TestPrice, DiscountTier, CorporateDiscount)
+        ),
+        with_loader_criteria(
+            BranchTestCapability,
+            lambda cls: cls.branch_id.in_(select(Branch.id).where(Branch.laboratory_id == laboratory_id)),
+            include_aliases=True,
+        ),
+    )
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _add_current_price_criteria(execute_state: ORMExecuteState) -> None:
+    # Only currently valid prices are loaded - in direct selects and in
+    # relationship loads such as Test.prices - so queries never re-state the
+    # effective_to predicate. History/audit reads opt out with
+    # .execution_options(include_expired_prices=True).
+    if (
+        not execute_state.is_select
+        or execute_state.execution_options.get("include_expired_prices", False)
+    ):
+        return
+
+    from app.models import TestPrice
+
+    execute_state.statement = execute_state.statement.options(
+        with_loader_criteria(
+            TestPrice,
+            lambda cls: or_(cls.effective_to.is_(None), cls.effective_to > func.now()),
+            include_aliases=True,
+        ),
+    )
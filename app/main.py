@@ -1,41 +1,109 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Optional
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from redis.asyncio import Redis
+from app.cache import ResponseCacheMiddleware, get_redis, index_cached_routes
+from app.cache.reference import ReferenceCache
 from app.core.config import settings
+from app.core.request_memo import RequestMemoMiddleware
+
+IS_PRODUCTION = settings.ENVIRONMENT == "production"
+REDIS_CACHE_ENABLED = settings.CACHE_ENABLED and settings.CACHE_TYPE == "redis"
+
+
+def include_routers(app: FastAPI) -> None:
+    """Import and mount the API routers.
+
+    Imports live here rather than at module level so that importing
+    ``app.main`` stays cheap; the router modules (and their pydantic models)
+    are only loaded when the application actually starts.
+    """
+    # Import routers (create these as needed)
+    # from app.api.endpoints import auth, users, data
+
+    # app.include_router(auth.router, prefix=f"{settings.API_PREFIX}/auth", tags=["auth"])
+    # app.include_router(users.router, prefix=f"{settings.API_PREFIX}/users", tags=["users"])
+
+
+def add_middleware(app: FastAPI, redis: Optional[Redis] = None) -> None:
+    """Install the middleware stack; each add wraps the ones added before it.
+
+    Outermost to innermost: CORS, then the response cache, then the request
+    memo. CORS must wrap the cache so cache hits carry the same
+    Access-Control-* and Vary headers as handler responses.
+    """
+    # Per-request memo store (inside the cache, so cache hits never allocate one)
+    app.add_middleware(RequestMemoMiddleware)
+
+    if redis is not None:
+        app.add_middleware(
+            ResponseCacheMiddleware,
+            redis=redis,
+            key_prefix=settings.CACHE_KEY_PREFIX,
+        )
+
+    # Configure CORS - a frozenset makes the per-request origin check a hash lookup
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=frozenset(settings.CORS_ORIGINS),
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    include_routers(app)
+    app.state.cached_routes = index_cached_routes(app.routes, settings.CACHE_DEFAULT_TTL)
+
+    app.state.reference = ReferenceCache()
+    await app.state.reference.load()
+    reference_listener = None
+    if REDIS_CACHE_ENABLED:
+        reference_listener = asyncio.create_task(app.state.reference.listen(get_redis()))
+
+    if app.openapi_url:
+        # Build the schema once, after every route is registered, so the
+        # first /docs hit doesn't pay for walking all the pydantic models.
+        app.openapi()
+    yield
+    if reference_listener is not None:
+        reference_listener.cancel()
+    if REDIS_CACHE_ENABLED:
+        await get_redis().aclose()
 
-# Import routers (create these as needed)
-# from app.api.endpoints import auth, users, data
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version=settings.VERSION,
     description="Logos System API",
-    openapi_url=f"{settings.API_PREFIX}/docs" if settings.ENVIRONMENT != "production" else None,
+    openapi_url=None if IS_PRODUCTION else f"{settings.API_PREFIX}/docs",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
-# Configure CORS
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.CORS_ORIGINS,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+add_middleware(app, redis=get_redis() if REDIS_CACHE_ENABLED else None)
 
-# Include routers
-# app.include_router(auth.router, prefix=f"{settings.API_PREFIX}/auth", tags=["auth"])
-# app.include_router(users.router, prefix=f"{settings.API_PREFIX}/users", tags=["users"])
+# Static payloads - encoded once at import, returned as-is per request
+_ROOT_RESPONSE = ORJSONResponse({
+    "message": f"Welcome to {settings.PROJECT_NAME}",
+    "version": settings.VERSION,
+    "status": settings.SYSTEM_STATUS,
+})
+_HEALTH_RESPONSE = ORJSONResponse({
+    "status": "healthy",
+    "environment": settings.ENVIRONMENT,
+})
 
 @app.get("/")
 async def root():
-    return {
-        "message": f"Welcome to {settings.PROJECT_NAME}",
-        "version": settings.VERSION,
-        "status": settings.SYSTEM_STATUS,
-    }
+    return _ROOT_RESPONSE
 
 @app.get("/health")
 async def health_check():
-    return {
-        "status": "healthy",
-        "environment": settings.ENVIRONMENT,
-    }
\ No newline at end of file
+    return _HEALTH_RESPONSE
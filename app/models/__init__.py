@@ -1,3 +1,5 @@
+from app.db.base import Base
+
 from .core.branch_model import Branch
 from .core.department_model import Department, Specialization
 from .core.laboratory_model import Laboratory
@@ -11,3 +13,10 @@ from .staff.user_model import (
     User,
 
 )
+from .testing.test_catalog_model import TestCategory, Test, TestDetails, TestPanel, TestPanelItem
+from .testing.test_capability_model import BranchTestCapability
+from .testing.test_pricing_model import TestPrice, DiscountTier, CorporateDiscount
+
+# Resolve the remaining string relationship targets (User <-> Department etc.)
+# once at startup instead of inside the first request's query.
+Base.registry.configure()
@@ -1,18 +1,22 @@
 from typing import Optional, List, TYPE_CHECKING
 
-from sqlalchemy import String, Boolean, Integer, DateTime, Float, ForeignKey, Index, CheckConstraint
+from geoalchemy2 import Geography, WKBElement
+from sqlalchemy import String, Boolean, Integer, DateTime, ForeignKey, Index, CheckConstraint, Enum, FetchedValue
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 
 from app.db.base import Base
+from app.models.core.laboratory_model import Laboratory
 
 if TYPE_CHECKING:
-    from app.models.core.laboratory_model import Laboratory
     from app.models.core.department_model import Department
     from app.models.staff.user_model import User
     from app.models.testing.test_capability_model import BranchTestCapability
 
 
+BranchType = Enum("main_lab", "satellite_lab", "collection_point", "reference_center", name="branch_type_enum")
+
+
 class Branch(Base):
     """Physical lab locations where services are provided."""
 
@@ -30,14 +34,13 @@ class Branch(Base):
     )
 
     # Identification
-    name: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
-    code: Mapped[str] = mapped_column(String(20), nullable=False, index=True)
+    name: Mapped[str] = mapped_column(String(100), nullable=False)
+    code: Mapped[str] = mapped_column(String(20), nullable=False)
     display_name: Mapped[Optional[str]] = mapped_column(String(150), nullable=True)
 
     # Branch Type & Role
-    branch_type: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
-    # Types: main_lab, satellite_lab, collection_point, reference_center
-    is_main_branch: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False, index=True)
+    branch_type: Mapped[str] = mapped_column(BranchType, nullable=False)
+    is_main_branch: Mapped[bool] = mapped_column(Boolean, server_default=text("false"), nullable=False)
 
     # Location
     address: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -46,9 +49,12 @@ class Branch(Base):
     country: Mapped[str] = mapped_column(String(100), nullable=False, default="Ghana")
     postal_code: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
 
-    # GPS Coordinates (for mapping/routing)
-    latitude: Mapped[Optional[Float]] = mapped_column(Float, nullable=True)
-    longitude: Mapped[Optional[Float]] = mapped_column(Float, nullable=True)
+    # GPS Coordinates (for mapping/routing) - WGS84 point, nearest-branch queries use
+    # ORDER BY location <-> ST_MakePoint(lon, lat)::geography against the GiST index
+    location: Mapped[Optional[WKBElement]] = mapped_column(
+        Geography("POINT", srid=4326, spatial_index=False),
+        nullable=True
+    )
 
     # Contact
     phone: Mapped[str] = mapped_column(String(20), nullable=False)
@@ -59,33 +65,34 @@ class Branch(Base):
     timezone: Mapped[str] = mapped_column(String(50), nullable=False, default="Africa/Accra")
 
     # Capabilities
-    has_testing_equipment: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
-    can_process_samples: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
-    sample_collection_only: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    has_testing_equipment: Mapped[bool] = mapped_column(Boolean, server_default=text("true"), nullable=False)
+    can_process_samples: Mapped[bool] = mapped_column(Boolean, server_default=text("true"), nullable=False)
+    sample_collection_only: Mapped[bool] = mapped_column(Boolean, server_default=text("false"), nullable=False)
 
     # Capacity
     daily_sample_capacity: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
 
     # Status
-    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False, index=True)
+    is_active: Mapped[bool] = mapped_column(Boolean, server_default=text("true"), nullable=False)
 
     # Audit
     created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now(),
-                                                 onupdate=func.now(), nullable=False)
+                                                 server_onupdate=FetchedValue(), nullable=False)  # set_updated_at trigger
 
-    # Relationships
-    laboratory_rel: Mapped["Laboratory"] = relationship(
-        "Laboratory",
+    # Relationships (lazy="raise" - opt in per query, e.g. .options(selectinload(Branch.departments)))
+    laboratory_rel: Mapped[Laboratory] = relationship(
+        Laboratory,
         back_populates="branches",
-        lazy="joined"
+        lazy="raise"
     )
 
     departments: Mapped[List["Department"]] = relationship(
         "Department",
         back_populates="branch_rel",
-        lazy="selectin",
-        cascade="all, delete-orphan"
+        lazy="raise",
+        cascade="all, delete-orphan",
+        passive_deletes=True
     )
 
     users: Mapped[List["User"]] = relationship(
@@ -97,14 +104,23 @@ class Branch(Base):
     test_capabilities: Mapped[List["BranchTestCapability"]] = relationship(
         "BranchTestCapability",
         back_populates="branch_rel",
-        lazy="noload"
+        lazy="noload",
+        passive_deletes=True
     )
 
     # Constraints & Indexes
     __table_args__ = (
         Index("idx_branch_lab_code", "laboratory_id", "code", unique=True),
-        Index("idx_branch_lab_active", "laboratory_id", "is_active"),
-        Index("idx_branch_type_active", "branch_type", "is_active"),
+        # Partial indexes on the minority boolean values
+        Index("idx_branch_main", "laboratory_id", postgresql_where=text("is_main_branch IS TRUE")),
+        Index("idx_branch_inactive", "laboratory_id", postgresql_where=text("is_active IS FALSE")),
+        Index("idx_branch_location_gist", "location", postgresql_using="gist"),
+        # Covers "active branches of type X in lab L ordered by name" as an index-only scan
+        Index(
+            "idx_branch_lab_active_type_name",
+            "laboratory_id", "is_active", "branch_type", "name",
+            postgresql_include=["code", "city", "region"]
+        ),
         CheckConstraint(
             "(sample_collection_only = false) OR (sample_collection_only = true AND can_process_samples = false)",
             name="check_collection_point_logic"
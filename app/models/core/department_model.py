@@ -1,8 +1,10 @@
 from typing import Optional, List, TYPE_CHECKING
+from uuid import UUID
 
-from sqlalchemy import String, Boolean, Integer, DateTime, ForeignKey, Index
+from sqlalchemy import String, Boolean, Integer, DateTime, ForeignKey, Index, Enum, FetchedValue
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 
 from app.db.base import Base
 
@@ -11,6 +13,17 @@ if TYPE_CHECKING:
     from app.models.staff.user_model import User
 
 
+DepartmentType = Enum(
+    "clinical_chemistry", "hematology", "microbiology", "immunology", "molecular_biology",
+    "histopathology", "sample_collection", "quality_control", "administration",
+    name="department_type_enum"
+)
+SpecializationCategory = Enum(
+    "scientist", "technician", "phlebotomist", "admin", "management", "it_support",
+    name="specialization_category_enum"
+)
+
+
 class Department(Base):
     """Lab departments within branches (e.g., Hematology, Microbiology)."""
 
@@ -28,17 +41,15 @@ class Department(Base):
     )
 
     # Identification
-    name: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
-    code: Mapped[str] = mapped_column(String(20), nullable=False, index=True)
+    name: Mapped[str] = mapped_column(String(100), nullable=False)
+    code: Mapped[str] = mapped_column(String(20), nullable=False)
 
     # Classification
-    department_type: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
-    # Types: clinical_chemistry, hematology, microbiology, immunology,
-    #        molecular_biology, histopathology, sample_collection, quality_control, administration
+    department_type: Mapped[str] = mapped_column(DepartmentType, nullable=False)
 
     # Department Head (nullable - can be set later)
-    head_user_id: Mapped[Optional[str]] = mapped_column(
-        String,
+    head_user_id: Mapped[Optional[UUID]] = mapped_column(
+        PGUUID(as_uuid=True),
         ForeignKey("users.id", ondelete="SET NULL"),
         nullable=True
     )
@@ -48,18 +59,20 @@ class Department(Base):
     daily_test_capacity: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
 
     # Status
-    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False, index=True)
+    is_active: Mapped[bool] = mapped_column(Boolean, server_default=text("true"), nullable=False)
 
     # Audit
     created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now(),
-                                                 onupdate=func.now(), nullable=False)
+                                                 server_onupdate=FetchedValue(), nullable=False)  # set_updated_at trigger
 
-    # Relationships
+    # Relationships (lazy="raise" - opt in per query, e.g. .options(selectinload(Department.branch_rel)))
     branch_rel: Mapped["Branch"] = relationship(
         "Branch",
         back_populates="departments",
-        lazy="joined"
+        # Served from the identity map when the branch is already loaded; otherwise use
+        # .options(joinedload(Department.branch_rel).joinedload(Branch.laboratory_rel))
+        lazy="raise_on_sql"
     )
 
     users: Mapped[List["User"]] = relationship(
@@ -72,14 +85,16 @@ class Department(Base):
     head_user: Mapped[Optional["User"]] = relationship(
         "User",
         foreign_keys=[head_user_id],
-        lazy="joined",
+        lazy="raise",
         post_update=True
     )
 
     # Constraints & Indexes
     __table_args__ = (
         Index("idx_department_branch_code", "branch_id", "code", unique=True),
-        Index("idx_department_type_active", "department_type", "is_active"),
+        Index("idx_dept_branch_active_type_name", "branch_id", "is_active", "department_type", "name"),
+        Index("idx_department_inactive", "branch_id", postgresql_where=text("is_active IS FALSE")),
+        Index("idx_department_head_user", "head_user_id", postgresql_where=text("head_user_id IS NOT NULL")),
     )
 
     def __repr__(self) -> str:
@@ -99,25 +114,24 @@ class Specialization(Base):
     code: Mapped[str] = mapped_column(String(20), unique=True, nullable=False, index=True)
 
     # Classification
-    category: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
-    # Categories: scientist, technician, phlebotomist, admin, management, it_support
+    category: Mapped[str] = mapped_column(SpecializationCategory, nullable=False)
 
     # Requirements
-    requires_license: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    requires_license: Mapped[bool] = mapped_column(Boolean, server_default=text("false"), nullable=False)
     minimum_education: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
 
     # Permissions/Capabilities
-    can_approve_results: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
-    can_perform_tests: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
-    can_collect_samples: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    can_approve_results: Mapped[bool] = mapped_column(Boolean, server_default=text("false"), nullable=False)
+    can_perform_tests: Mapped[bool] = mapped_column(Boolean, server_default=text("true"), nullable=False)
+    can_collect_samples: Mapped[bool] = mapped_column(Boolean, server_default=text("false"), nullable=False)
 
     # Status
-    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False, index=True)
+    is_active: Mapped[bool] = mapped_column(Boolean, server_default=text("true"), nullable=False)
 
     # Audit
     created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now(),
-                                                 onupdate=func.now(), nullable=False)
+                                                 server_onupdate=FetchedValue(), nullable=False)  # set_updated_at trigger
 
     # Relationships
     users: Mapped[List["User"]] = relationship(
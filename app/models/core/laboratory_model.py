@@ -1,14 +1,18 @@
 from typing import Optional, List, TYPE_CHECKING
 
-from sqlalchemy import String, Boolean, Integer, DateTime, Index
+from sqlalchemy import String, Boolean, Integer, DateTime, Index, Enum, FetchedValue
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 
 from app.db.base import Base
 
 if TYPE_CHECKING:
     from app.models.core.branch_model import Branch
-    from app.models.patient.patient_model import Patient
+
+
+LabType = Enum("independent", "hospital_lab", "reference_lab", "clinic_lab", name="lab_type_enum")
+SubscriptionTier = Enum("basic", "professional", "enterprise", name="subscription_tier_enum")
+SubscriptionStatus = Enum("active", "suspended", "cancelled", "trial", name="subscription_status_enum")
 
 
 class Laboratory(Base):
@@ -27,9 +31,8 @@ class Laboratory(Base):
     slug: Mapped[str] = mapped_column(String(100), unique=True, nullable=False, index=True)
 
     # Lab Configuration
-    lab_type: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
-    # Types: independent, hospital_lab, reference_lab, clinic_lab
-    is_multi_branch: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    lab_type: Mapped[str] = mapped_column(LabType, nullable=False)
+    is_multi_branch: Mapped[bool] = mapped_column(Boolean, server_default=text("false"), nullable=False)
 
     # Legal & Registration
     registration_number: Mapped[Optional[str]] = mapped_column(String(100), unique=True, nullable=True)
@@ -45,37 +48,32 @@ class Laboratory(Base):
     logo_url: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
 
     # Subscription (SaaS Model)
-    subscription_tier: Mapped[str] = mapped_column(String(50), nullable=False, default="basic")
-    # Tiers: basic, professional, enterprise
-    subscription_status: Mapped[str] = mapped_column(String(50), nullable=False, default="active", index=True)
-    # Status: active, suspended, cancelled, trial
-    max_branches: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
-    max_users: Mapped[int] = mapped_column(Integer, nullable=False, default=10)
+    subscription_tier: Mapped[str] = mapped_column(SubscriptionTier, nullable=False, default="basic")
+    subscription_status: Mapped[str] = mapped_column(SubscriptionStatus, nullable=False, default="active")
+    max_branches: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("1"))
+    max_users: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("10"))
     max_monthly_tests: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
 
     # Status
-    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False, index=True)
+    is_active: Mapped[bool] = mapped_column(Boolean, server_default=text("true"), nullable=False)
 
     # Audit
     created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now(),
-                                                 onupdate=func.now(), nullable=False)
+                                                 server_onupdate=FetchedValue(), nullable=False)  # set_updated_at trigger
 
-    # Relationships
+    # Relationships (lazy="raise" - opt in per query, e.g. .options(selectinload(Laboratory.branches)))
     branches: Mapped[List["Branch"]] = relationship(
         "Branch",
         back_populates="laboratory_rel",
-        lazy="selectin",
-        cascade="all, delete-orphan"
-    )
-
-    patients: Mapped[List["Patient"]] = relationship(
-        "Patient",
-        back_populates="laboratory_rel",
-        lazy="noload"  # Don't load all patients by default
+        lazy="select",  # see services.laboratory_service for the single-lab loader
+        cascade="all, delete-orphan",
+        passive_deletes=True
     )
 
     # Indexes
+    # Also serves is_active-only and (is_active, subscription_status) filters;
+    # lab_type is low-cardinality and only ever read alongside other filters
     __table_args__ = (
         Index("idx_lab_active_subscription", "is_active", "subscription_status"),
     )
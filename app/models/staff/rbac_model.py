@@ -1,6 +1,7 @@
-from typing import TYPE_CHECKING, List, Optional
+from functools import cached_property
+from typing import TYPE_CHECKING, Iterable, List, Optional
 
-from sqlalchemy import Column, Integer, String, Table, ForeignKey, Index, DateTime, Boolean
+from sqlalchemy import Column, Integer, String, Table, ForeignKey, Index, DateTime, Boolean, event
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from sqlalchemy.sql import func
@@ -18,8 +19,8 @@ user_roles = Table(
     Column("role_id", Integer, ForeignKey("roles.id", ondelete="CASCADE"), primary_key=True),
     Column("assigned_at", DateTime(timezone=True), server_default=func.now(), nullable=False),
     Column("assigned_by", PGUUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True),
-    Index("idx_user_roles_user", "user_id"),
-    Index("idx_user_roles_role", "role_id"),
+    # The (user_id, role_id) primary key already serves user -> roles as an index-only scan
+    Index("idx_user_roles_role", "role_id", postgresql_include=["user_id"]),
 )
 
 role_permissions = Table(
@@ -28,8 +29,8 @@ role_permissions = Table(
     Column("role_id", Integer, ForeignKey("roles.id", ondelete="CASCADE"), primary_key=True),
     Column("permission_id", Integer, ForeignKey("permissions.id", ondelete="CASCADE"), primary_key=True),
     Column("assigned_at", DateTime(timezone=True), server_default=func.now(), nullable=False),
-    Index("idx_role_perms_role", "role_id"),
-    Index("idx_role_perms_perm", "permission_id"),
+    # The (role_id, permission_id) primary key already serves role -> permissions as an index-only scan
+    Index("idx_role_perms_perm", "permission_id", postgresql_include=["role_id"]),
 )
 
 
@@ -42,7 +43,7 @@ class Role(Base):
     name: Mapped[str] = mapped_column(String(64), unique=True, nullable=False, index=True)
     description: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     is_system_role: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
-    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False, index=True)
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
 
     created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now(),
@@ -52,21 +53,46 @@ class Role(Base):
         "Permission",
         secondary=role_permissions,
         back_populates="roles",
-        lazy="selectin"
+        lazy="selectin",
+        passive_deletes=True
     )
 
     users: Mapped[List["User"]] = relationship(
         "User",
         secondary=user_roles,
+        primaryjoin="Role.id == user_roles.c.role_id",
+        secondaryjoin="user_roles.c.user_id == User.id",
         back_populates="roles",
-        lazy="noload"
+        lazy="noload",
+        passive_deletes=True
     )
 
     def __repr__(self) -> str:
         return f"<Role id={self.id} name='{self.name}'>"
 
+    @cached_property
+    def _permission_names(self) -> frozenset[str]:
+        return frozenset(p.name for p in self.permissions)
+
     def has_permission(self, permission_name: str) -> bool:
-        return any(p.name == permission_name for p in self.permissions)
+        return permission_name in self._permission_names
+
+    def has_any(self, permission_names: Iterable[str]) -> bool:
+        return not self._permission_names.isdisjoint(permission_names)
+
+    def has_all(self, permission_names: Iterable[str]) -> bool:
+        return self._permission_names.issuperset(permission_names)
+
+
+def _reset_permission_names(target: Role, *args) -> None:
+    target.__dict__.pop("_permission_names", None)
+
+
+# Drop the cached name set whenever the permissions collection changes or is reloaded
+for _identifier in ("append", "remove", "bulk_replace"):
+    event.listen(Role.permissions, _identifier, _reset_permission_names)
+event.listen(Role, "refresh", _reset_permission_names)
+event.listen(Role, "expire", _reset_permission_names)
 
 
 class Permission(Base):
@@ -79,7 +105,7 @@ class Permission(Base):
     resource: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
     action: Mapped[str] = mapped_column(String(32), nullable=False, index=True)
     description: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
-    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False, index=True)
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
 
     created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now(),
@@ -89,7 +115,8 @@ class Permission(Base):
         "Role",
         secondary=role_permissions,
         back_populates="permissions",
-        lazy="noload"
+        lazy="noload",
+        passive_deletes=True
     )
 
     __table_args__ = (
@@ -1,19 +1,32 @@
+from functools import cached_property
 from typing import TYPE_CHECKING, List, Optional
-from uuid import UUID, uuid4
+from uuid import UUID
 
-from sqlalchemy import String, Boolean, DateTime, Index, Text, Integer, ForeignKey, Date, CheckConstraint
-from sqlalchemy.dialects.postgresql import UUID as PGUUID
-from sqlalchemy.orm import relationship, Mapped, mapped_column
-from sqlalchemy.sql import func
+from sqlalchemy import String, Boolean, DateTime, Index, Text, Integer, ForeignKey, Date, CheckConstraint, Computed, Enum, FetchedValue, event, exists
+from sqlalchemy.dialects.postgresql import JSONB, UUID as PGUUID
+from sqlalchemy.ext.hybrid import hybrid_method
+from sqlalchemy.orm import relationship, Mapped, WriteOnlyMapped, mapped_column
+from sqlalchemy.sql import func, text
 
-from app.db import Base
+from app.db import Base, uuid7
+from app.models.staff.rbac_model import Role, user_roles
 
 if TYPE_CHECKING:
-    from app.models.staff.rbac_model import Role
     from app.models.core.department_model import Department, Specialization
     from app.models.core.branch_model import Branch
 
 
+EmployeeType = Enum("full_time", "part_time", "contract", "intern", "consultant", name="employee_type_enum")
+EmploymentStatus = Enum("active", "on_leave", "suspended", "terminated", name="employment_status_enum")
+
+# Predicate shared by the partial indexes over live (not deleted, active) staff
+_LIVE = text("is_deleted = false AND is_active = true")
+# Everything the login path reads after finding the user by email/username
+_LOGIN_COLUMNS = [
+    "hashed_password", "is_active", "is_verified", "account_locked_until", "failed_login_attempts", "laboratory_id",
+]
+
+
 class User(Base):
     """Lab staff members."""
 
@@ -23,7 +36,7 @@ class User(Base):
     id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True),
         primary_key=True,
-        default=uuid4
+        default=uuid7
     )
 
     # Tenant Isolation - Critical for multi-tenant security
@@ -31,8 +44,7 @@ class User(Base):
     laboratory_id: Mapped[int] = mapped_column(
         Integer,
         ForeignKey("laboratories.id", ondelete="RESTRICT"),
-        nullable=False,
-        index=True
+        nullable=False  # indexed as the leading column of the idx_user_lab_* composites
     )
 
     # Foreign Keys - Organizational Structure
@@ -58,24 +70,26 @@ class User(Base):
     )
 
     # Authentication
-    username: Mapped[str] = mapped_column(String(150), unique=True, nullable=False, index=True)
-    email: Mapped[str] = mapped_column(String(255), unique=True, nullable=False, index=True)
+    username: Mapped[str] = mapped_column(String(150), nullable=False)
+    email: Mapped[str] = mapped_column(String(255), nullable=False)
     hashed_password: Mapped[str] = mapped_column(String(255), nullable=False)
 
     # Profile
     first_name: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
     last_name: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
     middle_name: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
-    staff_id: Mapped[str] = mapped_column(String(50), unique=True, nullable=False, index=True)
+    full_name: Mapped[str] = mapped_column(
+        Text,
+        Computed("first_name || ' ' || coalesce(middle_name || ' ', '') || last_name", persisted=True)
+    )
+    staff_id: Mapped[str] = mapped_column(String(50), nullable=False)
     telephone: Mapped[str] = mapped_column(String(20), nullable=False, index=True)
     date_of_birth: Mapped[Optional[Date]] = mapped_column(Date, nullable=True)
     gender: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
 
     # Employment
-    employee_type: Mapped[str] = mapped_column(String(50), nullable=False, default="full_time", index=True)
-    # Types: full_time, part_time, contract, intern, consultant
-    employment_status: Mapped[str] = mapped_column(String(50), nullable=False, default="active", index=True)
-    # Status: active, on_leave, suspended, terminated
+    employee_type: Mapped[str] = mapped_column(EmployeeType, nullable=False, default="full_time", index=True)
+    employment_status: Mapped[str] = mapped_column(EmploymentStatus, nullable=False, default="active", index=True)
     hire_date: Mapped[Optional[DateTime]] = mapped_column(DateTime(timezone=True), nullable=True)
     termination_date: Mapped[Optional[DateTime]] = mapped_column(DateTime(timezone=True), nullable=True)
 
@@ -91,13 +105,17 @@ class User(Base):
         index=True
     )
 
-    # Additional Info
-    bio: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    residential_address: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
-    emergency_contact: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    # Additional Info - deferred; .options(undefer_group("profile_extras")) on detail views
+    bio: Mapped[Optional[str]] = mapped_column(Text, nullable=True, deferred=True, deferred_group="profile_extras")
+    residential_address: Mapped[Optional[str]] = mapped_column(
+        String(255), nullable=True, deferred=True, deferred_group="profile_extras"
+    )
+    emergency_contact: Mapped[Optional[str]] = mapped_column(
+        String(255), nullable=True, deferred=True, deferred_group="profile_extras"
+    )
 
     # Security & Access Control
-    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False, index=True)
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     is_verified: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     is_superuser: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False, index=True)
 
@@ -121,7 +139,7 @@ class User(Base):
     )
 
     # Soft Delete
-    is_deleted: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False, index=True)
+    is_deleted: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     deleted_at: Mapped[Optional[DateTime]] = mapped_column(DateTime(timezone=True), nullable=True)
     deleted_by: Mapped[Optional[UUID]] = mapped_column(
         PGUUID(as_uuid=True),
@@ -129,69 +147,113 @@ class User(Base):
         nullable=True
     )
 
+    # Denormalized copy of the user's role names, maintained by triggers on
+    # user_roles/roles; user_roles stays the source of truth
+    role_names: Mapped[List[str]] = mapped_column(
+        JSONB,
+        server_default=text("'[]'::jsonb"),
+        server_onupdate=FetchedValue(),
+        nullable=False
+    )
+
     # Relationships
+    # Authorization reads role_names; load roles explicitly when editing them
     roles: Mapped[List["Role"]] = relationship(
         "Role",
         secondary="user_roles",
+        primaryjoin="User.id == user_roles.c.user_id",
+        secondaryjoin="user_roles.c.role_id == Role.id",
         back_populates="users",
-        lazy="selectin"
+        lazy="raise_on_sql",
+        passive_deletes=True
     )
 
+    # Org-structure relationships are lazy="raise" - opt in per query, e.g.
+    # select(User).options(selectinload(User.branch_rel), selectinload(User.department_rel))
     branch_rel: Mapped["Branch"] = relationship(
         "Branch",
         back_populates="users",
-        lazy="joined"
+        lazy="raise"
     )
 
     department_rel: Mapped["Department"] = relationship(
         "Department",
         foreign_keys=[department_id],
         back_populates="users",
-        lazy="joined"
+        lazy="raise"
     )
 
     specialization_rel: Mapped["Specialization"] = relationship(
         "Specialization",
         back_populates="users",
-        lazy="joined"
+        lazy="raise"
     )
 
+    # Reporting lines never cross tenants; the laboratory_id term keeps both
+    # directions on idx_user_lab_supervisor
     supervisor: Mapped[Optional["User"]] = relationship(
         "User",
-        remote_side=[id],
+        primaryjoin="and_(User.supervisor_id == remote(User.id), "
+                    "User.laboratory_id == remote(User.laboratory_id))",
         foreign_keys=[supervisor_id],
-        lazy="joined",
+        back_populates="subordinates",
+        lazy="raise",
         post_update=True
     )
 
-    subordinates: Mapped[List["User"]] = relationship(
+    # Never loaded wholesale - page it: user.subordinates.select().where(...).limit(50)
+    subordinates: WriteOnlyMapped["User"] = relationship(
         "User",
-        remote_side=[supervisor_id],
+        primaryjoin="and_(User.id == remote(User.supervisor_id), "
+                    "User.laboratory_id == remote(User.laboratory_id))",
         foreign_keys=[supervisor_id],
-        lazy="noload",
+        back_populates="supervisor",
+        lazy="write_only",
+        passive_deletes=True,
         post_update=True
     )
 
     # Composite Indexes - Optimized for common queries
     __table_args__ = (
-        # Tenant isolation index - CRITICAL
-        Index("idx_user_lab_active", "laboratory_id", "is_active"),
+        # Tenant isolation index - CRITICAL (live rows only)
+        Index("idx_user_lab_live", "laboratory_id", postgresql_where=_LIVE),
         Index("idx_user_lab_branch", "laboratory_id", "branch_id"),
-
-        # Authentication indexes
-        Index("idx_user_email_active", "email", "is_active"),
-        Index("idx_user_username_active", "username", "is_active"),
-        Index("idx_user_staff_id_active", "staff_id", "is_active"),
+        # Staff listings: newest first within a lab
+        Index("idx_user_lab_created", "laboratory_id", "created_at", postgresql_where=text("is_deleted = false")),
+        # Active staff in a lab
+        Index("idx_user_lab_status", "laboratory_id", "employment_status", postgresql_where=_LIVE),
+
+        # Authentication - unique among non-deleted users (so soft-deleted
+        # identifiers can be reissued); login reads are index-only scans
+        Index("idx_user_email_login", "email", unique=True, postgresql_include=_LOGIN_COLUMNS,
+              postgresql_where=text("is_deleted = false")),
+        Index("idx_user_username_login", "username", unique=True, postgresql_include=_LOGIN_COLUMNS,
+              postgresql_where=text("is_deleted = false")),
+        Index("uq_user_staff_id_live", "laboratory_id", "staff_id", unique=True,
+              postgresql_where=text("is_deleted = false")),
+
+        # Name search (ILIKE '%...%') - needs pg_trgm
+        Index("idx_user_full_name_trgm", "full_name", postgresql_using="gin",
+              postgresql_ops={"full_name": "gin_trgm_ops"}),
+
+        # "Users with role X"
+        Index("idx_user_role_names_gin", "role_names", postgresql_using="gin"),
 
         # Organizational indexes
+        Index("idx_user_lab_supervisor", "laboratory_id", "supervisor_id",
+              postgresql_where=text("supervisor_id IS NOT NULL AND is_deleted = false")),
         Index("idx_user_branch_dept", "branch_id", "department_id"),
         Index("idx_user_dept_spec", "department_id", "specialization_id"),
 
         # Employment indexes
         Index("idx_user_employment", "employee_type", "employment_status"),
 
-        # Soft delete index
-        Index("idx_user_deleted", "is_deleted", "deleted_at"),
+        # Audit range scans ("created in the last 24h") - created_at follows insert order
+        Index("idx_user_created_brin", "created_at", postgresql_using="brin",
+              postgresql_with={"pages_per_range": 32}),
+
+        # Soft delete index - purge/audit of deleted rows
+        Index("idx_user_deleted", "deleted_at", postgresql_where=text("is_deleted = true")),
 
         # Check constraints
         CheckConstraint(
@@ -203,12 +265,37 @@ class User(Base):
     def __repr__(self) -> str:
         return f"<User {self.staff_id}: {self.first_name} {self.last_name}>"
 
-    @property
-    def full_name(self) -> str:
-        if self.middle_name:
-            return f"{self.first_name} {self.middle_name} {self.last_name}"
-        return f"{self.first_name} {self.last_name}"
+    @cached_property
+    def _role_names(self) -> frozenset[str]:
+        return frozenset(self.role_names or ())
 
+    @hybrid_method
     def has_role(self, role_name: str) -> bool:
-        """Check if user has specific role."""
-        return any(role.name == role_name for role in self.roles)
+        """
+        Check if user has specific role, as of the last load of role_names.
+        role_names is written by database triggers, so after changing a user's
+        roles in this session it is stale until reloaded:
+        `await db.refresh(user, ["role_names"])`. For an authoritative check
+        use the SQL side, e.g. select(User.has_role("admin")).where(User.id == user_id).
+        """
+        return role_name in self._role_names
+
+    @has_role.expression
+    def has_role(cls, role_name: str):
+        # EXISTS over user_roles -> roles; no role rows are loaded, e.g.
+        # select(User.id).where(User.id == user_id, User.has_role("admin"))
+        return exists().where(
+            user_roles.c.user_id == cls.id,
+            user_roles.c.role_id == Role.id,
+            Role.name == role_name,
+        )
+
+
+def _reset_role_names(target: User, *args) -> None:
+    target.__dict__.pop("_role_names", None)
+
+
+# Drop the cached name set whenever role_names is assigned or reloaded
+event.listen(User.role_names, "set", _reset_role_names)
+event.listen(User, "refresh", _reset_role_names)
+event.listen(User, "expire", _reset_role_names)
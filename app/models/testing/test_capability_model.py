@@ -1,14 +1,12 @@
-from typing import Optional, TYPE_CHECKING
+from typing import Optional
 
 from sqlalchemy import Boolean, Integer, DateTime, ForeignKey, Index, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 
 from app.db.base import Base
-
-if TYPE_CHECKING:
-    from app.models.testing.test_catalog_model import Test
-    from app.models.core.branch_model import Branch
+from app.models.testing.test_catalog_model import Test
+from app.models.core.branch_model import Branch
 
 
 class BranchTestCapability(Base):
@@ -38,7 +36,7 @@ class BranchTestCapability(Base):
     )
 
     # Capability
-    can_perform: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False, index=True)
+    can_perform: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
 
     # Processing Details (overrides test defaults)
     turnaround_time_hours: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
@@ -48,22 +46,29 @@ class BranchTestCapability(Base):
     notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     # Status
-    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False, index=True)
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
 
     # Audit
     created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now(),
                                                  onupdate=func.now(), nullable=False)
 
-    # Relationships
-    branch_rel: Mapped["Branch"] = relationship("Branch", back_populates="test_capabilities", lazy="joined")
-    test_rel: Mapped["Test"] = relationship("Test", back_populates="branch_capabilities", lazy="joined")
+    # Relationships - load explicitly, e.g.
+    # .options(selectinload(Test.branch_capabilities).selectinload(BranchTestCapability.branch_rel))
+    branch_rel: Mapped[Branch] = relationship(Branch, back_populates="test_capabilities", lazy="raise_on_sql")
+    test_rel: Mapped[Test] = relationship(Test, back_populates="branch_capabilities", lazy="raise_on_sql")
 
     # Constraints & Indexes
     __table_args__ = (
-        Index("idx_branch_test", "branch_id", "test_id", unique=True),
-        Index("idx_branch_capable", "branch_id", "can_perform", "is_active"),
-        Index("idx_test_capable", "test_id", "can_perform", "is_active"),
+        # "Can branch X perform test Y, and how fast" - index-only over active rows
+        Index("idx_branch_test_covering", "branch_id", "test_id", unique=True,
+              postgresql_include=["can_perform", "turnaround_time_hours", "daily_capacity"],
+              postgresql_where=text("is_active")),
+        # "What can branch X perform" - index-only over active rows
+        Index("idx_branch_capable", "branch_id", "can_perform",
+              postgresql_include=["test_id", "daily_capacity"],
+              postgresql_where=text("is_active")),
+        Index("idx_test_capable", "test_id", "can_perform", postgresql_where=text("is_active")),
     )
 
     def __repr__(self) -> str:
@@ -1,8 +1,8 @@
 from typing import Optional, List, TYPE_CHECKING
 
-from sqlalchemy import String, Boolean, Integer, DateTime, Text, ForeignKey, Index
+from sqlalchemy import String, Boolean, Integer, DateTime, Text, ForeignKey, Index, Enum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 
 from app.db.base import Base
 
@@ -11,17 +11,25 @@ if TYPE_CHECKING:
     from app.models.testing.test_pricing_model import TestPrice
 
 
+SpecimenType = Enum(
+    "blood_serum", "blood_plasma", "blood_whole", "urine", "stool", "csf", "sputum", "swab", "tissue",
+    name="specimen_type_enum",
+)
+ResultType = Enum("quantitative", "qualitative", "semi_quantitative", "text", "image", name="result_type_enum")
+ComplexityLevel = Enum("waived", "standard", "high_complexity", "specialized", name="complexity_level_enum")
+
+
 class TestCategory(Base):
     """Test categories (e.g., Hematology, Chemistry)."""
 
     __tablename__ = "test_categories"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    name: Mapped[str] = mapped_column(String(100), unique=True, nullable=False, index=True)
-    code: Mapped[str] = mapped_column(String(20), unique=True, nullable=False, index=True)
-    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    name: Mapped[str] = mapped_column(String(100), nullable=False)
+    code: Mapped[str] = mapped_column(String(20), nullable=False)
+    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True, deferred=True, deferred_group="details")
     sort_order: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
-    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False, index=True)
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
 
     created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now(),
@@ -29,6 +37,13 @@ class TestCategory(Base):
 
     tests: Mapped[List["Test"]] = relationship("Test", back_populates="category_rel", lazy="noload")
 
+    __table_args__ = (
+        # Unique among active categories; retired names/codes can be reused
+        Index("idx_category_name", "name", unique=True, postgresql_where=text("is_active")),
+        Index("idx_category_code", "code", unique=True, postgresql_where=text("is_active")),
+        Index("idx_category_active_sort", "sort_order", postgresql_where=text("is_active")),
+    )
+
     def __repr__(self) -> str:
         return f"<TestCategory id={self.id} code='{self.code}'>"
 
@@ -53,18 +68,14 @@ class Test(Base):
     )
 
     # Identification
-    name: Mapped[str] = mapped_column(String(200), nullable=False, index=True)
+    name: Mapped[str] = mapped_column(String(200), nullable=False)
     code: Mapped[str] = mapped_column(String(50), unique=True, nullable=False, index=True)
     short_name: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
 
-    # Test Details
-    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    clinical_significance: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    preparation_instructions: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # Long-form text lives in TestDetails (test_details)
 
     # Specimen Requirements
-    specimen_type: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
-    # Types: blood_serum, blood_plasma, blood_whole, urine, stool, csf, sputum, swab, tissue
+    specimen_type: Mapped[str] = mapped_column(SpecimenType, nullable=False)
     specimen_volume: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
     specimen_container: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     specimen_storage_temp: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
@@ -75,25 +86,22 @@ class Test(Base):
     urgent_turnaround_time_hours: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
 
     # Result Information
-    result_type: Mapped[str] = mapped_column(String(50), nullable=False, default="quantitative")
-    # Types: quantitative, qualitative, semi_quantitative, text, image
+    result_type: Mapped[str] = mapped_column(ResultType, nullable=False, default="quantitative")
     unit_of_measurement: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
-    reference_range_text: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
 
     # Test Complexity
-    complexity_level: Mapped[str] = mapped_column(String(20), nullable=False, default="standard", index=True)
-    # Levels: waived, standard, high_complexity, specialized
+    complexity_level: Mapped[str] = mapped_column(ComplexityLevel, nullable=False, default="standard")
 
     # Equipment & Accreditation
     requires_specialized_equipment: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     requires_accreditation: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
 
     # Display & Popularity
-    is_popular: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False, index=True)
+    is_popular: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     display_order: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
 
     # Status
-    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False, index=True)
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
 
     # Audit
     created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -103,29 +111,71 @@ class Test(Base):
     # Relationships
     category_rel: Mapped["TestCategory"] = relationship("TestCategory", back_populates="tests", lazy="joined")
 
+    # Opt in with .options(selectinload(Test.details))
+    details: Mapped[Optional["TestDetails"]] = relationship(
+        "TestDetails",
+        back_populates="test_rel",
+        uselist=False,
+        lazy="raise",
+        cascade="all, delete-orphan",
+        passive_deletes=True
+    )
+
+    # Opt in with .options(selectinload(Test.prices), selectinload(Test.branch_capabilities))
     branch_capabilities: Mapped[List["BranchTestCapability"]] = relationship(
         "BranchTestCapability",
         back_populates="test_rel",
-        lazy="noload"
+        lazy="raise_on_sql",
+        passive_deletes=True
     )
 
     prices: Mapped[List["TestPrice"]] = relationship(
         "TestPrice",
         back_populates="test_rel",
-        lazy="noload"
+        lazy="raise_on_sql",
+        passive_deletes=True
     )
 
     # Indexes
     __table_args__ = (
-        Index("idx_test_category_active", "category_id", "is_active"),
+        # Active-only partials; booleans alone are too coarse for the planner to use
+        Index("idx_test_active_cat", "category_id", "name", postgresql_where=text("is_active")),
+        Index("idx_test_popular", "display_order", postgresql_where=text("is_popular AND is_active")),
         Index("idx_test_complexity_active", "complexity_level", "is_active"),
         Index("idx_test_specimen", "specimen_type"),
+        # Fuzzy/ILIKE name search; exact lookups go through the unique code index
+        Index("idx_test_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
     )
 
     def __repr__(self) -> str:
         return f"<Test id={self.id} code='{self.code}'>"
 
 
+class TestDetails(Base):
+    """
+    Descriptive text for a test, kept out of `tests` so catalog listings and
+    autocomplete scan narrow rows. One row per test.
+    """
+
+    __tablename__ = "test_details"
+
+    test_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("tests.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+
+    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    clinical_significance: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    preparation_instructions: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    reference_range_text: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
+
+    test_rel: Mapped["Test"] = relationship("Test", back_populates="details")
+
+    def __repr__(self) -> str:
+        return f"<TestDetails test={self.test_id}>"
+
+
 class TestPanel(Base):
     """Test panels/packages - groups of tests sold together."""
 
@@ -142,20 +192,21 @@ class TestPanel(Base):
     )
 
     # Identification
-    name: Mapped[str] = mapped_column(String(200), nullable=False, index=True)
+    name: Mapped[str] = mapped_column(String(200), nullable=False)
     code: Mapped[str] = mapped_column(String(50), unique=True, nullable=False, index=True)
-    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    clinical_use: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # Long text is deferred - .options(undefer_group("details")) to load it
+    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True, deferred=True, deferred_group="details")
+    clinical_use: Mapped[Optional[str]] = mapped_column(Text, nullable=True, deferred=True, deferred_group="details")
 
     # Pricing
     is_discounted: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
 
     # Display
-    is_popular: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False, index=True)
+    is_popular: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     display_order: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
 
     # Status
-    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False, index=True)
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
 
     # Audit
     created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -168,13 +219,21 @@ class TestPanel(Base):
         "TestPanelItem",
         back_populates="panel_rel",
         lazy="selectin",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True
     )
 
     prices: Mapped[List["TestPrice"]] = relationship(
         "TestPrice",
         back_populates="panel_rel",
-        lazy="noload"
+        lazy="noload",
+        passive_deletes=True
+    )
+
+    __table_args__ = (
+        Index("idx_panel_active_cat", "category_id", "name", postgresql_where=text("is_active")),
+        Index("idx_panel_popular", "display_order", postgresql_where=text("is_popular AND is_active")),
+        Index("idx_panel_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
     )
 
     def __repr__(self) -> str:
@@ -207,7 +266,8 @@ class TestPanelItem(Base):
 
     # Relationships
     panel_rel: Mapped["TestPanel"] = relationship("TestPanel", back_populates="panel_tests")
-    test_rel: Mapped["Test"] = relationship("Test", lazy="joined")
+    # selectinload(TestPanel.panel_tests).selectinload(TestPanelItem.test_rel)
+    test_rel: Mapped["Test"] = relationship("Test", lazy="raise")
 
     __table_args__ = (
         Index("idx_panel_test", "panel_id", "test_id", unique=True),
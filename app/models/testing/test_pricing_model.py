@@ -1,16 +1,36 @@
-from decimal import Decimal
-from typing import Optional, TYPE_CHECKING
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Optional
 
-from sqlalchemy import String, Boolean, Integer, DateTime, ForeignKey, Index, Numeric, CheckConstraint
+from sqlalchemy import String, Boolean, Integer, BigInteger, DateTime, ForeignKey, Index, CheckConstraint, Enum, Computed
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 
 from app.db.base import Base
+from app.models.testing.test_catalog_model import Test, TestPanel
+from app.models.core.laboratory_model import Laboratory
+from app.models.core.branch_model import Branch
 
-if TYPE_CHECKING:
-    from app.models.testing.test_catalog_model import Test, TestPanel
-    from app.models.core.laboratory_model import Laboratory
-    from app.models.core.branch_model import Branch
+
+PriceType = Enum("standard", "branch_specific", name="price_type_enum")
+DiscountPeriod = Enum("single_visit", "daily", "monthly", "yearly", name="discount_period_enum")
+
+
+def _decimal_view(attr: str, readonly: bool = False) -> property:
+    """
+    Decimal (2 places) view over an integer column stored in hundredths -
+    minor currency units for amounts, basis points for percentages.
+    """
+
+    def fget(self) -> Optional[Decimal]:
+        value = getattr(self, attr)
+        return None if value is None else Decimal(value).scaleb(-2)
+
+    def fset(self, value) -> None:
+        setattr(self, attr, None if value is None
+                else int((Decimal(value) * 100).to_integral_value(ROUND_HALF_UP)))
+
+    return property(fget, None if readonly else fset)
 
 
 class TestPrice(Base):
@@ -28,63 +48,65 @@ class TestPrice(Base):
     laboratory_id: Mapped[int] = mapped_column(
         Integer,
         ForeignKey("laboratories.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False  # leads every composite index below
     )
 
     # Foreign Keys - Either test_id OR panel_id (not both)
     test_id: Mapped[Optional[int]] = mapped_column(
         Integer,
         ForeignKey("tests.id", ondelete="CASCADE"),
-        nullable=True,
-        index=True
+        nullable=True
     )
 
     panel_id: Mapped[Optional[int]] = mapped_column(
         Integer,
         ForeignKey("test_panels.id", ondelete="CASCADE"),
-        nullable=True,
-        index=True
+        nullable=True
     )
 
     # Pricing Scope
-    price_type: Mapped[str] = mapped_column(String(20), nullable=False, index=True)
-    # Types: standard (lab-wide), branch_specific
+    price_type: Mapped[str] = mapped_column(PriceType, nullable=False)
+    # standard (lab-wide) or branch_specific
 
     # Branch-specific (null if standard)
     branch_id: Mapped[Optional[int]] = mapped_column(
         Integer,
         ForeignKey("branches.id", ondelete="CASCADE"),
-        nullable=True,
-        index=True
+        nullable=True
     )
 
-    # Pricing
-    base_price: Mapped[Decimal] = mapped_column(Numeric(10, 2), nullable=False)
+    # Pricing - integer minor units (pesewas) and basis points; Decimal views below
+    base_price_cents: Mapped[int] = mapped_column(BigInteger, nullable=False)
     currency: Mapped[str] = mapped_column(String(3), nullable=False, default="GHS")
-    discount_percentage: Mapped[Decimal] = mapped_column(Numeric(5, 2), nullable=False, default=0)
-    final_price: Mapped[Decimal] = mapped_column(Numeric(10, 2), nullable=False)
+    discount_bps: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    final_price_cents: Mapped[int] = mapped_column(
+        BigInteger,
+        # Integer round-half-up of base * (1 - discount)
+        Computed("(base_price_cents * (10000 - discount_bps) + 5000) / 10000", persisted=True),
+        nullable=False
+    )
 
     # Urgent Pricing
-    urgent_price: Mapped[Optional[Decimal]] = mapped_column(Numeric(10, 2), nullable=True)
+    urgent_price_cents: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
 
     # Price Validity Period
     effective_from: Mapped[DateTime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
     effective_to: Mapped[Optional[DateTime]] = mapped_column(DateTime(timezone=True), nullable=True)
 
     # Status
-    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False, index=True)
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
 
     # Audit
     created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now(),
                                                  onupdate=func.now(), nullable=False)
 
-    # Relationships
-    laboratory_rel: Mapped["Laboratory"] = relationship("Laboratory", lazy="joined")
-    test_rel: Mapped[Optional["Test"]] = relationship("Test", back_populates="prices", lazy="joined")
-    panel_rel: Mapped[Optional["TestPanel"]] = relationship("TestPanel", back_populates="prices", lazy="joined")
-    branch_rel: Mapped[Optional["Branch"]] = relationship("Branch", lazy="joined")
+    # Relationships - lazy="raise"; opt in per query, e.g.
+    # select(TestPrice).options(selectinload(TestPrice.test_rel), selectinload(TestPrice.branch_rel))
+    laboratory_rel: Mapped[Laboratory] = relationship(Laboratory, lazy="raise")
+    test_rel: Mapped[Optional[Test]] = relationship(Test, back_populates="prices", lazy="raise")
+    panel_rel: Mapped[Optional[TestPanel]] = relationship(TestPanel, back_populates="prices", lazy="raise")
+    branch_rel: Mapped[Optional[Branch]] = relationship(Branch, lazy="raise")
 
     # Constraints & Indexes
     __table_args__ = (
@@ -98,6 +120,7 @@ class TestPrice(Base):
             "(price_type = 'standard' AND branch_id IS NULL) OR (price_type = 'branch_specific' AND branch_id IS NOT NULL)",
             name="check_branch_price_consistency"
         ),
+        CheckConstraint("discount_bps BETWEEN 0 AND 10000", name="check_price_discount_bps"),
         # Unique pricing per scope
         Index("idx_test_standard_price", "laboratory_id", "test_id", "price_type", unique=True,
               postgresql_where="price_type = 'standard' AND test_id IS NOT NULL"),
@@ -107,9 +130,22 @@ class TestPrice(Base):
               postgresql_where="price_type = 'standard' AND panel_id IS NOT NULL"),
         Index("idx_panel_branch_price", "laboratory_id", "panel_id", "branch_id", unique=True,
               postgresql_where="price_type = 'branch_specific' AND panel_id IS NOT NULL"),
+        # Per-item lookups without a tenant (Test.prices / TestPanel.prices, FK cascades)
+        Index("idx_price_test", "test_id", postgresql_where=text("test_id IS NOT NULL")),
+        Index("idx_price_panel", "panel_id", postgresql_where=text("panel_id IS NOT NULL")),
         # Query optimization indexes
-        Index("idx_price_lab_active", "laboratory_id", "is_active"),
         Index("idx_price_validity", "effective_from", "effective_to"),
+        # Append-mostly timestamps - BRIN summaries for history/audit range scans
+        Index("idx_testprice_effective_brin", "effective_from", postgresql_using="brin"),
+        Index("idx_testprice_created_brin", "created_at", postgresql_using="brin"),
+        # Order-time price resolution (lab + item + branch, latest effective_from)
+        # as a single index-only scan
+        Index("idx_test_price_active_lookup", "laboratory_id", "test_id", "branch_id", "effective_from",
+              postgresql_where=text("is_active AND test_id IS NOT NULL"),
+              postgresql_include=["final_price_cents", "urgent_price_cents", "currency", "effective_to", "price_type"]),
+        Index("idx_panel_price_active_lookup", "laboratory_id", "panel_id", "branch_id", "effective_from",
+              postgresql_where=text("is_active AND panel_id IS NOT NULL"),
+              postgresql_include=["final_price_cents", "urgent_price_cents", "currency", "effective_to", "price_type"]),
     )
 
     def __repr__(self) -> str:
@@ -117,6 +153,25 @@ class TestPrice(Base):
         item_id = self.test_id or self.panel_id
         return f"<TestPrice {item_type}={item_id} type={self.price_type} price={self.final_price}>"
 
+    base_price = _decimal_view("base_price_cents")
+    discount_percentage = _decimal_view("discount_bps")
+    final_price = _decimal_view("final_price_cents", readonly=True)
+    urgent_price = _decimal_view("urgent_price_cents")
+
+    @hybrid_property
+    def priced_item_id(self) -> int:
+        """test_id or panel_id, whichever is set (check_test_or_panel)."""
+        return self.test_id if self.test_id is not None else self.panel_id
+
+    @priced_item_id.expression
+    def priced_item_id(cls):
+        return func.coalesce(cls.test_id, cls.panel_id)
+
+    @property
+    def priced_item(self) -> Test | TestPanel:
+        """The priced test or panel; needs the matching relationship loaded."""
+        return self.test_rel if self.test_id is not None else self.panel_rel
+
 
 class DiscountTier(Base):
     """Volume-based discount tiers (e.g., spend GHS 500 get 10% off)."""
@@ -129,8 +184,7 @@ class DiscountTier(Base):
     laboratory_id: Mapped[int] = mapped_column(
         Integer,
         ForeignKey("laboratories.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False  # leads idx_discount_lab_active / idx_tier_eligible
     )
 
     # Tier Details
@@ -138,20 +192,19 @@ class DiscountTier(Base):
     description: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
 
     # Threshold & Discount
-    minimum_amount: Mapped[Decimal] = mapped_column(Numeric(10, 2), nullable=False, index=True)
-    discount_percentage: Mapped[Decimal] = mapped_column(Numeric(5, 2), nullable=False)
-    fixed_discount_amount: Mapped[Optional[Decimal]] = mapped_column(Numeric(10, 2), nullable=True)
+    minimum_amount_cents: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    discount_bps: Mapped[int] = mapped_column(Integer, nullable=False)
+    fixed_discount_amount_cents: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
 
     # Application Scope
-    applies_to: Mapped[str] = mapped_column(String(20), nullable=False, default="single_visit")
-    # Types: single_visit, daily, monthly, yearly
+    applies_to: Mapped[str] = mapped_column(DiscountPeriod, nullable=False, default="single_visit")
 
     # Validity
     effective_from: Mapped[DateTime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
     effective_to: Mapped[Optional[DateTime]] = mapped_column(DateTime(timezone=True), nullable=True)
 
     # Status
-    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False, index=True)
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
 
     # Audit
     created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -159,16 +212,25 @@ class DiscountTier(Base):
                                                  onupdate=func.now(), nullable=False)
 
     # Relationships
-    laboratory_rel: Mapped["Laboratory"] = relationship("Laboratory", lazy="joined")
+    laboratory_rel: Mapped[Laboratory] = relationship(Laboratory, lazy="raise")
 
     __table_args__ = (
         Index("idx_discount_lab_active", "laboratory_id", "is_active"),
-        Index("idx_discount_threshold", "minimum_amount"),
+        # Best eligible tier: WHERE laboratory_id = ? AND is_active AND minimum_amount_cents <= ?
+        # ORDER BY minimum_amount_cents DESC LIMIT 1 as one index-only range scan
+        Index("idx_tier_eligible", "laboratory_id", text("minimum_amount_cents DESC"),
+              postgresql_where=text("is_active"),
+              postgresql_include=["discount_bps", "fixed_discount_amount_cents", "applies_to"]),
+        Index("idx_discount_effective_brin", "effective_from", postgresql_using="brin"),
     )
 
     def __repr__(self) -> str:
         return f"<DiscountTier {self.name}: {self.minimum_amount}+ = {self.discount_percentage}%>"
 
+    minimum_amount = _decimal_view("minimum_amount_cents")
+    discount_percentage = _decimal_view("discount_bps")
+    fixed_discount_amount = _decimal_view("fixed_discount_amount_cents")
+
 
 class CorporateDiscount(Base):
     """Corporate/organizational discounts."""
@@ -181,19 +243,18 @@ class CorporateDiscount(Base):
     laboratory_id: Mapped[int] = mapped_column(
         Integer,
         ForeignKey("laboratories.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False  # leads every index below
     )
 
     # Organization Details
-    organization_name: Mapped[str] = mapped_column(String(200), nullable=False, index=True)
-    organization_code: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
+    organization_name: Mapped[str] = mapped_column(String(200), nullable=False)
+    organization_code: Mapped[str] = mapped_column(String(50), nullable=False)
     contact_person: Mapped[Optional[str]] = mapped_column(String(200), nullable=True)
     contact_email: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     contact_phone: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
 
     # Discount
-    discount_percentage: Mapped[Decimal] = mapped_column(Numeric(5, 2), nullable=False)
+    discount_bps: Mapped[int] = mapped_column(Integer, nullable=False)
     applies_to_all_tests: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
 
     # Contract
@@ -202,7 +263,7 @@ class CorporateDiscount(Base):
     contract_end_date: Mapped[Optional[DateTime]] = mapped_column(DateTime(timezone=True), nullable=True)
 
     # Status
-    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False, index=True)
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
 
     # Audit
     created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -210,12 +271,25 @@ class CorporateDiscount(Base):
                                                  onupdate=func.now(), nullable=False)
 
     # Relationships
-    laboratory_rel: Mapped["Laboratory"] = relationship("Laboratory", lazy="joined")
+    laboratory_rel: Mapped[Laboratory] = relationship(Laboratory, lazy="raise")
 
     __table_args__ = (
-        Index("idx_corporate_lab_code", "laboratory_id", "organization_code", unique=True),
-        Index("idx_corporate_active", "is_active"),
+        # Unique among active rows only, so a lapsed contract's code can be reissued.
+        # Also the order-time lookup: contract_end_date is filtered from the INCLUDE
+        # payload (now() can't sit in an index predicate), so no heap visits
+        Index("idx_corporate_lab_code", "laboratory_id", "organization_code", unique=True,
+              postgresql_where=text("is_active"),
+              postgresql_include=["discount_bps", "applies_to_all_tests", "contract_number", "contract_end_date"]),
+        Index("idx_corporate_lab_active", "laboratory_id", "organization_name", postgresql_where=text("is_active")),
+        # Name autocomplete: LIKE 'acme%' (and lower(organization_name) LIKE 'acme%' for
+        # case-insensitive) need pattern opclasses under a non-C collation
+        Index("idx_corp_name_prefix", "laboratory_id", "organization_name",
+              postgresql_ops={"organization_name": "text_pattern_ops"}, postgresql_where=text("is_active")),
+        Index("idx_corp_name_lower", "laboratory_id", text("lower(organization_name) text_pattern_ops"),
+              postgresql_where=text("is_active")),
     )
 
     def __repr__(self) -> str:
         return f"<CorporateDiscount {self.organization_name}: {self.discount_percentage}%>"
+
+    discount_percentage = _decimal_view("discount_bps")
@@ -0,0 +1,48 @@
+from datetime import datetime
+from decimal import Decimal
+from typing import Literal, Optional
+
+from pydantic import BaseModel, Field, model_validator  # type: ignore
+
+# Same domains as the price_type_enum / discount_period_enum columns
+PriceType = Literal["standard", "branch_specific"]
+DiscountPeriod = Literal["single_visit", "daily", "monthly", "yearly"]
+
+
+class TestPriceCreate(BaseModel):
+
+    test_id: Optional[int] = None
+    panel_id: Optional[int] = None
+    price_type: PriceType = "standard"
+    branch_id: Optional[int] = None
+
+    base_price: Decimal = Field(..., ge=0, max_digits=12, decimal_places=2)
+    currency: str = Field("GHS", min_length=3, max_length=3)
+    discount_percentage: Decimal = Field(Decimal("0"), ge=0, le=100, decimal_places=2)
+    urgent_price: Optional[Decimal] = Field(None, ge=0, max_digits=12, decimal_places=2)
+
+    effective_from: Optional[datetime] = None
+    effective_to: Optional[datetime] = None
+
+    @model_validator(mode="after")
+    def validate_scope(self) -> "TestPriceCreate":
+        """Mirror check_test_or_panel / check_branch_price_consistency."""
+        if (self.test_id is None) == (self.panel_id is None):
+            raise ValueError("Exactly one of test_id or panel_id is required")
+        if (self.price_type == "branch_specific") != (self.branch_id is not None):
+            raise ValueError("branch_id is required for branch_specific prices, and only for them")
+        return self
+
+
+class DiscountTierCreate(BaseModel):
+
+    name: str = Field(..., min_length=1, max_length=100)
+    description: Optional[str] = Field(None, max_length=500)
+
+    minimum_amount: Decimal = Field(..., ge=0, max_digits=12, decimal_places=2)
+    discount_percentage: Decimal = Field(..., ge=0, le=100, decimal_places=2)
+    fixed_discount_amount: Optional[Decimal] = Field(None, ge=0, max_digits=12, decimal_places=2)
+    applies_to: DiscountPeriod = "single_visit"
+
+    effective_from: Optional[datetime] = None
+    effective_to: Optional[datetime] = None
@@ -13,6 +13,9 @@ from pydantic import ( # type: ignore
 )
 
 
+_STAFF_ID_RE = re.compile(r"STF-[A-Z0-9]{6}")
+
+
 class DepartmentBase(BaseModel):
 
     id: int
@@ -33,6 +36,27 @@ class SpecializationBase(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class _StaffBaseLoose(BaseModel):
+    """
+    Read-side staff fields as plain types. Values come from rows that already
+    passed StaffBase on write, so responses skip email/URL/length validation.
+    """
+
+    username: str
+    full_name: str
+    telephone: str
+    email: str
+
+    department_id: int
+    specialization_id: int
+
+    staff_id: Optional[str] = None
+    bio: Optional[str] = None
+    residential_address: Optional[str] = None
+    linkedin_profile: Optional[str] = None
+    website: Optional[str] = None
+
+
 class StaffBase(BaseModel):
     
     username: str = Field(..., min_length=3, max_length=50)
@@ -54,8 +78,11 @@ class StaffBase(BaseModel):
     @field_validator("staff_id")
     @classmethod
     def validate_staff_id(cls, v: str) -> str:
-        v = v.strip().upper()
-        if not re.fullmatch(r"STF-[A-Z0-9]{6}", v):
+        # Already-canonical input (the usual case) is checked as-is, without
+        # allocating stripped/uppercased copies
+        if not (v.isascii() and v.isupper() and not v[:1].isspace() and not v[-1:].isspace()):
+            v = v.strip().upper()
+        if not _STAFF_ID_RE.fullmatch(v):
             raise ValueError("staff_id must be in format STF-XXXXXX")
         return v
 
@@ -71,9 +98,17 @@ class StaffCreate(StaffBase):
     def validate_password(cls, v: str) -> str:
         if len(v) < 8:
             raise ValueError('Password must be at least 8 characters')
-        has_upper = any(c.isupper() for c in v)
-        has_lower = any(c.islower() for c in v)
-        has_digit = any(c.isdigit() for c in v)
+        # One pass, stopping as soon as all three classes have been seen
+        has_upper = has_lower = has_digit = False
+        for c in v:
+            if c.isupper():
+                has_upper = True
+            elif c.islower():
+                has_lower = True
+            elif c.isdigit():
+                has_digit = True
+            if has_upper and has_lower and has_digit:
+                break
         if not (has_upper and has_lower and has_digit):
             raise ValueError('Password must contain uppercase, lowercase, and digit')
         return v
@@ -102,8 +137,11 @@ class StaffUpdate(BaseModel):
     website: Optional[HttpUrl] = None
     password: Optional[str] = Field(None, min_length=8)
 
+    # Cold schemas: core schema is built on first use, not at import
+    model_config = ConfigDict(defer_build=True, extra="forbid")
+
 
-class StaffResponse(StaffBase):
+class StaffResponse(_StaffBaseLoose):
 
     id: UUID
     is_active: bool
@@ -115,18 +153,19 @@ class StaffResponse(StaffBase):
     department: DepartmentBase
     specialization: SpecializationBase
     
-    model_config = ConfigDict(
-        from_attributes=True,
-        json_encoders={HttpUrl: lambda v: str(v) if v else None}
-    )
+    model_config = ConfigDict(from_attributes=True, validate_assignment=False)
 
 
 class StaffLogin(BaseModel):
     username: str = Field(..., min_length=3, max_length=50)
     password: str = Field(..., min_length=8, max_length=100)
 
+    model_config = ConfigDict(defer_build=True, extra="forbid")
+
 
 class LoginResponse(BaseModel):
     access_token: str
     token_type: str = "bearer"
-    data: StaffResponse
\ No newline at end of file
+    data: StaffResponse
+
+    model_config = ConfigDict(defer_build=True, from_attributes=True)
\ No newline at end of file
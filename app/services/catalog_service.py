@@ -0,0 +1,61 @@
+from dataclasses import dataclass, fields
+from typing import Optional, Sequence
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.cache.catalog import catalog_cache
+from app.models.testing.test_catalog_model import Test
+
+
+@dataclass(frozen=True, slots=True)
+class CatalogTest:
+    """Read-only snapshot of a catalog test, safe to share across sessions."""
+
+    id: int
+    category_id: int
+    name: str
+    code: str
+    short_name: Optional[str]
+    specimen_type: str
+    specimen_volume: Optional[str]
+    specimen_container: Optional[str]
+    turnaround_time_hours: int
+    urgent_turnaround_time_hours: Optional[int]
+    result_type: str
+    unit_of_measurement: Optional[str]
+    complexity_level: str
+    is_popular: bool
+    display_order: int
+    is_active: bool
+
+
+# Plain column select - no ORM identities are created, so nothing is attached
+# to the loading session or to the cache
+_CATALOG_TEST_COLUMNS = tuple(getattr(Test, f.name) for f in fields(CatalogTest))
+
+
+async def get_test(db: AsyncSession, test_id: int) -> Optional[CatalogTest]:
+    """One catalog test, served from the catalog cache."""
+    key = ("test", test_id)
+    test = catalog_cache.get(key)
+    if test is None:
+        row = (await db.execute(select(*_CATALOG_TEST_COLUMNS).where(Test.id == test_id))).first()
+        if row is not None:
+            test = CatalogTest(*row)
+            catalog_cache.set(key, test)
+    return test
+
+
+async def list_tests(db: AsyncSession, category_id: int, active_only: bool = True) -> Sequence[CatalogTest]:
+    """Tests in a category ordered for display, served from the catalog cache."""
+    key = ("tests", category_id, active_only)
+    tests = catalog_cache.get(key)
+    if tests is None:
+        stmt = select(*_CATALOG_TEST_COLUMNS).where(Test.category_id == category_id)
+        if active_only:
+            stmt = stmt.where(Test.is_active.is_(True))
+        result = await db.execute(stmt.order_by(Test.display_order, Test.name))
+        tests = tuple(CatalogTest(*row) for row in result)
+        catalog_cache.set(key, tests)
+    return tests
@@ -0,0 +1,22 @@
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
+
+from app.models.core.branch_model import Branch
+from app.models.core.laboratory_model import Laboratory
+
+
+async def get_laboratory_with_branches(db: AsyncSession, laboratory_id: int) -> Optional[Laboratory]:
+    """
+    Load one laboratory with its branches and their departments.
+    A lab has only a handful of branches, so they are JOINed into the main
+    query instead of costing a second round-trip; departments use selectin.
+    """
+    result = await db.execute(
+        select(Laboratory)
+        .where(Laboratory.id == laboratory_id)
+        .options(joinedload(Laboratory.branches).selectinload(Branch.departments))
+    )
+    return result.unique().scalar_one_or_none()
@@ -0,0 +1,24 @@
+from typing import Sequence
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.models.testing.test_pricing_model import TestPrice
+
+
+async def get_prices_with_items(db: AsyncSession, price_ids: Sequence[int]) -> Sequence[TestPrice]:
+    """
+    Load prices with their priced item (see TestPrice.priced_item).
+    A row has a test XOR a panel, so instead of outer-joining both sides each
+    relationship is selectin-loaded: one IN query over the non-NULL test_ids,
+    one over the non-NULL panel_ids, and neither when no row needs it.
+    """
+    if not price_ids:
+        return ()
+    result = await db.scalars(
+        select(TestPrice)
+        .where(TestPrice.id.in_(price_ids))
+        .options(selectinload(TestPrice.test_rel), selectinload(TestPrice.panel_rel))
+    )
+    return result.all()
@@ -0,0 +1,19 @@
+from app.models.staff.user_model import User
+from app.schemas.staff_schema.staff_schema import StaffResponse
+from app.services.taxonomy_cache import department_payload, specialization_payload
+
+_NESTED = ("department", "specialization")
+_SCALAR_FIELDS = tuple(name for name in StaffResponse.model_fields if name not in _NESTED)
+
+
+def to_staff_response(user: User) -> StaffResponse:
+    """
+    Serialize a staff member. Load with
+    .options(selectinload(User.department_rel), selectinload(User.specialization_rel),
+    undefer_group("profile_extras")) - a 50-row listing spanning 5 departments
+    validates 5 DepartmentBase payloads, not 50.
+    """
+    data = {name: getattr(user, name, None) for name in _SCALAR_FIELDS}
+    data["department"] = department_payload(user.department_rel)
+    data["specialization"] = specialization_payload(user.specialization_rel)
+    return StaffResponse.model_validate(data)
@@ -0,0 +1,60 @@
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.request_memo import request_memo
+from app.models.core.department_model import Department, Specialization
+from app.schemas.staff_schema.staff_schema import DepartmentBase, SpecializationBase
+
+# Owns the per-request "department"/"specialization" memos; everything that
+# validates these payloads goes through here so forget_* clears every path
+
+
+def department_payload(department: Department) -> DepartmentBase:
+    """DepartmentBase for an already-loaded department, validated once per request."""
+    memo = request_memo("department")
+    payload = memo.get(department.id)
+    if payload is None:
+        payload = memo[department.id] = DepartmentBase.model_validate(department)
+    return payload
+
+
+def specialization_payload(specialization: Specialization) -> SpecializationBase:
+    """SpecializationBase for an already-loaded specialization, validated once per request."""
+    memo = request_memo("specialization")
+    payload = memo.get(specialization.id)
+    if payload is None:
+        payload = memo[specialization.id] = SpecializationBase.model_validate(specialization)
+    return payload
+
+
+async def get_department(db: AsyncSession, department_id: int) -> Optional[DepartmentBase]:
+    """DepartmentBase by id, loaded and validated at most once per request."""
+    payload = request_memo("department").get(department_id)
+    if payload is None:
+        department = await db.get(Department, department_id)
+        if department is None:
+            return None
+        payload = department_payload(department)
+    return payload
+
+
+async def get_specialization(db: AsyncSession, specialization_id: int) -> Optional[SpecializationBase]:
+    """SpecializationBase by id, loaded and validated at most once per request."""
+    payload = request_memo("specialization").get(specialization_id)
+    if payload is None:
+        specialization = await db.get(Specialization, specialization_id)
+        if specialization is None:
+            return None
+        payload = specialization_payload(specialization)
+    return payload
+
+
+def forget_department(department_id: int) -> None:
+    """Call after updating a department so the rest of the request sees the change."""
+    request_memo("department").pop(department_id, None)
+
+
+def forget_specialization(specialization_id: int) -> None:
+    """Call after updating a specialization so the rest of the request sees the change."""
+    request_memo("specialization").pop(specialization_id, None)
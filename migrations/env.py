@@ -12,9 +12,6 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 from app.core.config import settings
 from app.db.base import Base
 
-# Import all models here so Alembic can detect them
-from app.models import *  # noqa
-
 # this is the Alembic Config object
 config = context.config
 
@@ -25,8 +22,17 @@ config.set_main_option("sqlalchemy.url", settings.ALEMBIC_DB_URL)
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
-# Add your model's MetaData object here for 'autogenerate' support
-target_metadata = Base.metadata
+# Commands that compare the models against the database; everything else
+# (upgrade, downgrade, current, stamp) runs without importing them
+_METADATA_COMMANDS = {"revision", "check"}
+
+
+def _load_models():
+    """Import every model so Base.metadata is complete, only when it is needed."""
+    cmd = getattr(config.cmd_opts, "cmd", None)
+    if cmd is None or cmd[0].__name__ in _METADATA_COMMANDS:
+        import app.models  # noqa: F401  (registers every table on Base.metadata)
+    return Base.metadata
 
 
 def run_migrations_offline() -> None:
@@ -43,7 +49,7 @@ def run_migrations_offline() -> None:
     url = config.get_main_option("sqlalchemy.url")
     context.configure(
         url=url,
-        target_metadata=target_metadata,
+        target_metadata=_load_models(),
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -53,7 +59,7 @@ def run_migrations_offline() -> None:
 
 
 def do_run_migrations(connection):
-    context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(connection=connection, target_metadata=_load_models())
 
     with context.begin_transaction():
         context.run_migrations()
@@ -65,10 +71,12 @@ async def run_migrations_online() -> None:
     In this scenario we need to create an Engine
     and associate a connection with the context.
     """
-    # Use the async engine
+    # Use the async engine; autogenerate reflects and compares many
+    # identically-shaped statements, so keep them in the compiled cache
     connectable = create_async_engine(
         settings.DATABASE_URL,
         poolclass=pool.NullPool,
+        query_cache_size=1200,
     )
 
     async with connectable.connect() as connection:
@@ -0,0 +1,71 @@
+"""refresh users.role_names when a user_roles row is updated
+
+Revision ID: a9d4e7f12c63
+Revises: f3b7c2d9e041
+Create Date: 2026-10-14 14:31:08.915442
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9d4e7f12c63'
+down_revision: Union[str, Sequence[str], None] = 'f3b7c2d9e041'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+ROLE_NAMES_OF = """
+    COALESCE(
+        (SELECT jsonb_agg(r.name ORDER BY r.name)
+         FROM user_roles ur JOIN roles r ON r.id = ur.role_id
+         WHERE ur.user_id = users.id),
+        '[]'::jsonb
+    )
+"""
+
+
+def _refresh_function(on_update: str) -> str:
+    return f"""
+        CREATE OR REPLACE FUNCTION refresh_user_role_names() RETURNS trigger AS $$
+        BEGIN
+            IF TG_TABLE_NAME = 'roles' THEN
+                UPDATE users SET role_names = {ROLE_NAMES_OF}
+                WHERE id IN (SELECT user_id FROM user_roles WHERE role_id = NEW.id);
+            ELSIF TG_OP = 'DELETE' THEN
+                UPDATE users SET role_names = {ROLE_NAMES_OF} WHERE id = OLD.user_id;
+            {on_update}
+            ELSE
+                UPDATE users SET role_names = {ROLE_NAMES_OF} WHERE id = NEW.user_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Moving an assignment (role_id or user_id changed) affects the old and
+    # the new user alike
+    op.execute(_refresh_function(
+        f"""ELSIF TG_OP = 'UPDATE' THEN
+                UPDATE users SET role_names = {ROLE_NAMES_OF} WHERE id IN (OLD.user_id, NEW.user_id);"""
+    ))
+    op.execute("DROP TRIGGER IF EXISTS trg_user_roles_role_names ON user_roles")
+    op.execute(
+        "CREATE TRIGGER trg_user_roles_role_names AFTER INSERT OR DELETE OR UPDATE OF user_id, role_id ON user_roles "
+        "FOR EACH ROW EXECUTE FUNCTION refresh_user_role_names()"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS trg_user_roles_role_names ON user_roles")
+    op.execute(
+        "CREATE TRIGGER trg_user_roles_role_names AFTER INSERT OR DELETE ON user_roles "
+        "FOR EACH ROW EXECUTE FUNCTION refresh_user_role_names()"
+    )
+    op.execute(_refresh_function(""))
@@ -0,0 +1,29 @@
+"""enable postgis
+
+Revision ID: c3a9f5e18d42
+Revises: b7e41c9d2f10
+Create Date: 2026-10-14 09:48:05.611937
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3a9f5e18d42'
+down_revision: Union[str, Sequence[str], None] = 'b7e41c9d2f10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Branch.location is a GEOGRAPHY(POINT, 4326) column
+    op.execute("CREATE EXTENSION IF NOT EXISTS postgis")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP EXTENSION IF EXISTS postgis")
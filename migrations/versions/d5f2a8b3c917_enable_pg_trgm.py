@@ -0,0 +1,29 @@
+"""enable pg_trgm
+
+Revision ID: d5f2a8b3c917
+Revises: c3a9f5e18d42
+Create Date: 2026-10-14 11:20:37.402518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5f2a8b3c917'
+down_revision: Union[str, Sequence[str], None] = 'c3a9f5e18d42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # idx_user_full_name_trgm uses the gin_trgm_ops operator class
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP EXTENSION IF EXISTS pg_trgm")
@@ -0,0 +1,77 @@
+"""add users.role_names maintained from user_roles
+
+Revision ID: e8c4d1a6b250
+Revises: d5f2a8b3c917
+Create Date: 2026-10-14 12:05:19.774631
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8c4d1a6b250'
+down_revision: Union[str, Sequence[str], None] = 'd5f2a8b3c917'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+ROLE_NAMES_OF = """
+    COALESCE(
+        (SELECT jsonb_agg(r.name ORDER BY r.name)
+         FROM user_roles ur JOIN roles r ON r.id = ur.role_id
+         WHERE ur.user_id = users.id),
+        '[]'::jsonb
+    )
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'users',
+        sa.Column('role_names', postgresql.JSONB(), server_default=sa.text("'[]'::jsonb"), nullable=False),
+    )
+    op.create_index('idx_user_role_names_gin', 'users', ['role_names'], postgresql_using='gin')
+
+    op.execute(
+        f"""
+        CREATE OR REPLACE FUNCTION refresh_user_role_names() RETURNS trigger AS $$
+        BEGIN
+            IF TG_TABLE_NAME = 'roles' THEN
+                UPDATE users SET role_names = {ROLE_NAMES_OF}
+                WHERE id IN (SELECT user_id FROM user_roles WHERE role_id = NEW.id);
+            ELSIF TG_OP = 'DELETE' THEN
+                UPDATE users SET role_names = {ROLE_NAMES_OF} WHERE id = OLD.user_id;
+            ELSE
+                UPDATE users SET role_names = {ROLE_NAMES_OF} WHERE id = NEW.user_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        "CREATE TRIGGER trg_user_roles_role_names AFTER INSERT OR DELETE ON user_roles "
+        "FOR EACH ROW EXECUTE FUNCTION refresh_user_role_names()"
+    )
+    op.execute(
+        "CREATE TRIGGER trg_roles_role_names AFTER UPDATE OF name ON roles "
+        "FOR EACH ROW WHEN (OLD.name IS DISTINCT FROM NEW.name) "
+        "EXECUTE FUNCTION refresh_user_role_names()"
+    )
+
+    # Backfill existing assignments
+    op.execute(f"UPDATE users SET role_names = {ROLE_NAMES_OF}")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS trg_roles_role_names ON roles")
+    op.execute("DROP TRIGGER IF EXISTS trg_user_roles_role_names ON user_roles")
+    op.execute("DROP FUNCTION IF EXISTS refresh_user_role_names()")
+    op.drop_index('idx_user_role_names_gin', table_name='users')
+    op.drop_column('users', 'role_names')
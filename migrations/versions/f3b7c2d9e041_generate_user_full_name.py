@@ -0,0 +1,66 @@
+"""store users.full_name as a generated column with a trigram index
+
+Revision ID: f3b7c2d9e041
+Revises: e8c4d1a6b250
+Create Date: 2026-10-14 14:02:51.260317
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3b7c2d9e041'
+down_revision: Union[str, Sequence[str], None] = 'e8c4d1a6b250'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Must match the Computed(...) expression on User.full_name; autogenerate
+# does not compare generated-column expressions, so this is maintained by hand
+FULL_NAME_OF = "first_name || ' ' || coalesce(middle_name || ' ', '') || last_name"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Name parts the generated column is built from, split out of the stored
+    # full_name for existing rows ("Ama Serwaa Mensah" -> "Ama" / "Serwaa Mensah")
+    op.execute(
+        "ALTER TABLE users "
+        "ADD COLUMN IF NOT EXISTS first_name varchar(100), "
+        "ADD COLUMN IF NOT EXISTS middle_name varchar(100), "
+        "ADD COLUMN IF NOT EXISTS last_name varchar(100)"
+    )
+    op.execute(
+        r"""
+        UPDATE users SET
+            first_name = split_part(btrim(full_name), ' ', 1),
+            last_name = regexp_replace(btrim(full_name), '^\S+\s*', '')
+        WHERE first_name IS NULL
+        """
+    )
+    op.alter_column('users', 'first_name', nullable=False)
+    op.alter_column('users', 'last_name', nullable=False)
+
+    op.execute("DROP INDEX IF EXISTS ix_users_full_name")
+    op.drop_column('users', 'full_name')
+    op.execute(f"ALTER TABLE users ADD COLUMN full_name text GENERATED ALWAYS AS ({FULL_NAME_OF}) STORED")
+
+    # ILIKE '%...%' name search; needs pg_trgm (d5f2a8b3c917)
+    op.execute("CREATE INDEX idx_user_full_name_trgm ON users USING gin (full_name gin_trgm_ops)")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_user_full_name_trgm', table_name='users')
+    op.drop_column('users', 'full_name')
+    op.add_column('users', sa.Column('full_name', sa.String(length=255), nullable=True))
+    op.execute(f"UPDATE users SET full_name = left({FULL_NAME_OF}, 255)")
+    op.alter_column('users', 'full_name', nullable=False)
+    op.create_index(op.f('ix_users_full_name'), 'users', ['full_name'], unique=False)
+
+    op.drop_column('users', 'last_name')
+    op.drop_column('users', 'middle_name')
+    op.drop_column('users', 'first_name')
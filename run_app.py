@@ -1,11 +1,19 @@
+import os
+
 import uvicorn
 from app.core.config import settings
 
 if __name__ == "__main__":
+    is_development = settings.ENVIRONMENT == "development"
     uvicorn.run(
         "app.main:app",
-        host="127.0.0.1",
-        port=8000,
-        reload=settings.ENVIRONMENT == "development",
+        host=settings.HOST,
+        port=settings.PORT,
+        # --reload is single-process; elsewhere run one worker per CPU
+        workers=1 if is_development else (settings.WORKERS or os.cpu_count() or 1),
+        loop="uvloop",
+        http="httptools",
+        reload=is_development,
         log_level="info",
+        access_log=is_development,
     )
@@ -4,81 +4,81 @@ import sys
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from app.db.session import AsyncSessionLocal
 from app.models.core.department_model import Department, Specialization
 
 
 async def seed_departments_and_specializations():
     """Seed initial departments and specializations."""
-    async with AsyncSessionLocal() as db:
+    async with AsyncSessionLocal() as db, db.begin():
         # Check if already seeded
-        result = await db.execute(select(Department))
+        result = await db.execute(select(Department.id).limit(1))
         if result.first():
             print("Data already seeded")
             return
 
         # Create departments
         departments = [
-            Department(
-                name="General Laboratory",
-                code="GENLAB",
-                description="General core services"
-            ),
-            Department(
-                name="Microbiology",
-                code="MICRO",
-                description="Microbiology department"
-            ),
-            Department(
-                name="Pathology",
-                code="PATH",
-                description="Pathology department"
-            ),
-            Department(
-                name="Hematology",
-                code="HEMA",
-                description="Hematology department"
-            ),
-            Department(
-                name="Administration",
-                code="ADMIN",
-                description="Administrative department"
-            ),
+            {
+                "name": "General Laboratory",
+                "code": "GENLAB",
+                "description": "General core services"
+            },
+            {
+                "name": "Microbiology",
+                "code": "MICRO",
+                "description": "Microbiology department"
+            },
+            {
+                "name": "Pathology",
+                "code": "PATH",
+                "description": "Pathology department"
+            },
+            {
+                "name": "Hematology",
+                "code": "HEMA",
+                "description": "Hematology department"
+            },
+            {
+                "name": "Administration",
+                "code": "ADMIN",
+                "description": "Administrative department"
+            },
         ]
 
         # Create specializations
         specializations = [
-            Specialization(
-                name="General Laboratory",
-                code="GENLAB",
-                description="General lab work"
-            ),
-            Specialization(
-                name="Clinical Chemistry",
-                code="CHEM",
-                description="Clinical chemistry"
-            ),
-            Specialization(
-                name="Hematology",
-                code="HEMA",
-                description="Blood disorders"
-            ),
-            Specialization(
-                name="Immunology",
-                code="IMMUNO",
-                description="Immune system"
-            ),
-            Specialization(
-                name="Medical Administration",
-                code="MEDADMIN",
-                description="Medical admin"
-            ),
+            {
+                "name": "General Laboratory",
+                "code": "GENLAB",
+                "description": "General lab work"
+            },
+            {
+                "name": "Clinical Chemistry",
+                "code": "CHEM",
+                "description": "Clinical chemistry"
+            },
+            {
+                "name": "Hematology",
+                "code": "HEMA",
+                "description": "Blood disorders"
+            },
+            {
+                "name": "Immunology",
+                "code": "IMMUNO",
+                "description": "Immune system"
+            },
+            {
+                "name": "Medical Administration",
+                "code": "MEDADMIN",
+                "description": "Medical admin"
+            },
         ]
 
-        db.add_all(departments)
-        db.add_all(specializations)
-        await db.commit()
+        # One multi-row INSERT per table, committed together by db.begin()
+        await db.execute(insert(Department), departments)
+        await db.execute(insert(Specialization), specializations)
 
         print(f"Seeded {len(departments)} departments")
         print(f"Seeded {len(specializations)} specializations")
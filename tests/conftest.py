@@ -0,0 +1,70 @@
+from contextlib import contextmanager
+from typing import Callable, ContextManager, Iterator
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.schema import CreateTable
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+import app.models  # noqa: F401  (configures every mapper)
+from app.models import CorporateDiscount, DiscountTier, Test, TestCategory, TestPanel, TestPrice
+
+# Tables with no PostgreSQL-only column types, so their behaviour can be
+# exercised on in-memory SQLite without a database server. Indexes are left
+# out: several use PostgreSQL operator classes and none matter for behaviour.
+SQLITE_TABLES = [
+    model.__table__ for model in (TestCategory, Test, TestPanel, TestPrice, DiscountTier, CorporateDiscount)
+]
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.fixture
+async def engine():
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    try:
+        async with engine.begin() as conn:
+            for table in SQLITE_TABLES:
+                await conn.execute(CreateTable(table))
+        yield engine
+    finally:
+        await engine.dispose()
+
+
+@pytest.fixture
+async def db(engine) -> AsyncSession:
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        yield session
+
+
+@pytest.fixture
+def query_budget(engine) -> Callable[[int], ContextManager[list[str]]]:
+    """
+    Fail the test if a block runs more than `limit` statements - a guard
+    against relationship or cache changes quietly turning a load into N+1:
+
+        with query_budget(1):
+            await list_tests(db, category_id)
+    """
+
+    @contextmanager
+    def budget(limit: int) -> Iterator[list[str]]:
+        statements: list[str] = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany) -> None:
+            statements.append(statement)
+
+        event.listen(engine.sync_engine, "before_cursor_execute", _record)
+        try:
+            yield statements
+        finally:
+            event.remove(engine.sync_engine, "before_cursor_execute", _record)
+        if len(statements) > limit:
+            listing = "\n".join(f"  {i}. {sql}" for i, sql in enumerate(statements, 1))
+            raise AssertionError(f"Expected at most {limit} queries, got {len(statements)}:\n{listing}")
+
+    return budget
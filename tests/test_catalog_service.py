@@ -0,0 +1,71 @@
+import pytest
+from sqlalchemy import update
+
+from app import models
+from app.cache.catalog import catalog_cache
+from app.services.catalog_service import CatalogTest, get_test, list_tests
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture(autouse=True)
+def _empty_catalog_cache():
+    catalog_cache.clear()
+    yield
+    catalog_cache.clear()
+
+
+@pytest.fixture
+async def category_id(db) -> int:
+    category = models.TestCategory(name="Hematology", code="HEM")
+    db.add(category)
+    await db.flush()
+    db.add_all([
+        models.Test(category_id=category.id, name="Full Blood Count", code="FBC", specimen_type="blood_whole",
+                    display_order=1),
+        models.Test(category_id=category.id, name="ESR", code="ESR", specimen_type="blood_whole",
+                    display_order=2),
+        models.Test(category_id=category.id, name="Retired", code="OLD", specimen_type="blood_whole",
+                    is_active=False),
+    ])
+    await db.commit()
+    return category.id
+
+
+async def test_list_tests_is_one_query_then_cached(db, category_id, query_budget):
+    with query_budget(1):
+        tests = await list_tests(db, category_id)
+    assert [t.code for t in tests] == ["FBC", "ESR"]
+    assert all(isinstance(t, CatalogTest) for t in tests)
+
+    with query_budget(0):
+        assert await list_tests(db, category_id) == tests
+
+
+async def test_cached_test_is_an_immutable_snapshot(db, category_id):
+    test = await get_test(db, 1)
+    assert isinstance(test, CatalogTest)
+    with pytest.raises(AttributeError):
+        test.name = "changed"
+
+
+async def test_commit_clears_the_cache(db, category_id, query_budget):
+    await list_tests(db, category_id)
+    fbc = await db.get(models.Test, 1)
+    fbc.name = "FBC (automated)"
+    await db.commit()
+
+    with query_budget(1):
+        tests = await list_tests(db, category_id)
+    assert tests[0].name == "FBC (automated)"
+
+
+async def test_rollback_keeps_the_cache(db, category_id, query_budget):
+    cached = await list_tests(db, category_id)
+    fbc = await db.get(models.Test, 1)
+    fbc.name = "never committed"
+    await db.flush()
+    await db.rollback()
+
+    with query_budget(0):
+        assert await list_tests(db, category_id) == cached
@@ -0,0 +1,16 @@
+import pytest
+
+from app.core.config import load_settings
+
+
+@pytest.mark.parametrize("raw, expected", [("true", True), ("On", True), ("1", True), ("false", False), ("NO", False)])
+def test_bool_settings_accept_known_spellings(monkeypatch, raw, expected):
+    monkeypatch.setenv("CACHE_ENABLED", raw)
+    assert load_settings().CACHE_ENABLED is expected
+
+
+@pytest.mark.parametrize("raw", ["ture", "yes please", ""])
+def test_bool_settings_reject_typos(monkeypatch, raw):
+    monkeypatch.setenv("CACHE_ENABLED", raw)
+    with pytest.raises(ValueError, match="CACHE_ENABLED"):
+        load_settings()
@@ -0,0 +1,51 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+
+from app import models
+
+pytestmark = pytest.mark.anyio
+
+NOW = datetime.now(timezone.utc)
+
+
+@pytest.fixture
+async def widal_id(db) -> int:
+    category = models.TestCategory(name="Serology", code="SER")
+    db.add(category)
+    await db.flush()
+    test = models.Test(category_id=category.id, name="Widal", code="WID", specimen_type="blood_serum")
+    db.add(test)
+    await db.flush()
+    db.add_all([
+        # open-ended, still valid, and one that ended last year
+        models.TestPrice(laboratory_id=1, test_id=test.id, price_type="standard", base_price_cents=1000),
+        models.TestPrice(laboratory_id=1, test_id=test.id, price_type="branch_specific", branch_id=1,
+                         base_price_cents=1100, effective_to=NOW + timedelta(days=365)),
+        models.TestPrice(laboratory_id=1, test_id=test.id, price_type="branch_specific", branch_id=2,
+                         base_price_cents=900, effective_to=NOW - timedelta(days=365)),
+    ])
+    await db.commit()
+    db.expunge_all()
+    return test.id
+
+
+async def test_expired_prices_are_filtered(db, widal_id):
+    prices = (await db.scalars(select(models.TestPrice))).all()
+    assert sorted(p.base_price_cents for p in prices) == [1000, 1100]
+
+
+async def test_expired_prices_are_filtered_from_relationship_loads(db, widal_id):
+    test = await db.scalar(
+        select(models.Test).where(models.Test.id == widal_id).options(selectinload(models.Test.prices))
+    )
+    assert sorted(p.base_price_cents for p in test.prices) == [1000, 1100]
+
+
+async def test_include_expired_prices_opts_out(db, widal_id):
+    prices = (await db.scalars(
+        select(models.TestPrice).execution_options(include_expired_prices=True)
+    )).all()
+    assert sorted(p.base_price_cents for p in prices) == [900, 1000, 1100]
@@ -0,0 +1,54 @@
+from decimal import ROUND_HALF_UP, Decimal
+
+import pytest
+
+from app import models
+
+CENT = Decimal("0.01")
+
+
+@pytest.mark.parametrize("value, cents", [
+    (Decimal("10"), 1000),
+    (Decimal("10.005"), 1001),   # half rounds up
+    (Decimal("10.004"), 1000),
+    ("0.015", 2),
+    (12, 1200),
+    (Decimal("99999999.99"), 9999999999),
+])
+def test_decimal_view_stores_hundredths_rounding_half_up(value, cents):
+    price = models.TestPrice(base_price=value)
+    assert price.base_price_cents == cents
+    assert price.base_price == Decimal(cents).scaleb(-2)
+
+
+def test_decimal_view_passes_none_through():
+    price = models.TestPrice(urgent_price=None)
+    assert price.urgent_price_cents is None
+    assert price.urgent_price is None
+
+
+def test_percentages_are_basis_points():
+    tier = models.DiscountTier(discount_percentage=Decimal("12.5"))
+    assert tier.discount_bps == 1250
+    assert tier.discount_percentage == Decimal("12.50")
+
+
+def test_final_price_is_read_only():
+    with pytest.raises(AttributeError):
+        models.TestPrice().final_price = Decimal("1")
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("base_cents, bps", [
+    (1000, 0), (1001, 1250), (100, 50), (1000, 50), (199, 3333), (1, 5000), (12345, 10000), (9999999999, 1),
+])
+async def test_final_price_cents_rounds_half_up(db, base_cents, bps):
+    price = models.TestPrice(laboratory_id=1, test_id=1, price_type="standard",
+                             base_price_cents=base_cents, discount_bps=bps)
+    db.add(price)
+    await db.flush()
+    await db.refresh(price, ["final_price_cents"])
+
+    expected = (Decimal(base_cents) * (10000 - bps) / 10000).quantize(Decimal(1), ROUND_HALF_UP)
+    assert price.final_price_cents == int(expected)
+    assert price.final_price == Decimal(int(expected)).scaleb(-2).quantize(CENT)
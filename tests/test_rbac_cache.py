@@ -0,0 +1,30 @@
+import asyncio
+import logging
+import uuid
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.cache import rbac
+
+pytestmark = pytest.mark.anyio
+
+
+class FailingRedis:
+
+    async def delete(self, *keys):
+        raise RedisConnectionError("redis is down")
+
+
+async def test_failed_invalidation_is_logged_and_released(monkeypatch, caplog):
+    monkeypatch.setattr(rbac, "get_redis", lambda: FailingRedis())
+
+    task = asyncio.get_running_loop().create_task(rbac._invalidate({uuid.uuid4()}, everything=False))
+    rbac._pending.add(task)
+    task.add_done_callback(rbac._invalidation_done)
+    with caplog.at_level(logging.ERROR, logger=rbac.__name__):
+        await asyncio.gather(task, return_exceptions=True)
+        await asyncio.sleep(0)  # let done-callbacks run
+
+    assert task not in rbac._pending
+    assert "Permission cache invalidation failed" in caplog.text
@@ -0,0 +1,105 @@
+from fastapi import FastAPI, Request, Response
+from fastapi.testclient import TestClient
+
+from app.cache import cache_response, index_cached_routes
+from app.main import add_middleware
+
+ORIGIN = "http://localhost:3000"
+
+
+class FakeRedis:
+    """The slice of redis.asyncio.Redis that ResponseCacheMiddleware uses."""
+
+    def __init__(self) -> None:
+        self.hashes: dict[str, dict[bytes, bytes]] = {}
+
+    async def hgetall(self, key: str) -> dict[bytes, bytes]:
+        return dict(self.hashes.get(key, {}))
+
+    def pipeline(self, transaction: bool = True) -> "FakePipeline":
+        return FakePipeline(self)
+
+
+class FakePipeline:
+
+    def __init__(self, redis: FakeRedis) -> None:
+        self.redis = redis
+        self.ops: list = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        return None
+
+    def hset(self, key: str, mapping: dict) -> None:
+        self.ops.append((key, {k.encode(): v.encode() if isinstance(v, str) else v for k, v in mapping.items()}))
+
+    def expire(self, key: str, ttl: int) -> None:
+        pass
+
+    async def execute(self) -> None:
+        for key, mapping in self.ops:
+            self.redis.hashes[key] = mapping
+
+
+def _client(redis: FakeRedis) -> TestClient:
+    app = FastAPI()
+
+    @app.get("/cached")
+    @cache_response()
+    async def cached(response: Response):
+        response.headers["cache-control"] = "public, max-age=60"
+        response.headers["etag"] = '"v1"'
+        response.headers["x-catalog-version"] = "7"
+        return {"ok": True}
+
+    @app.get("/per-lab")
+    @cache_response(vary=("x-laboratory",))
+    async def per_lab(request: Request):
+        return {"lab": request.headers.get("x-laboratory")}
+
+    add_middleware(app, redis=redis)
+    app.state.cached_routes = index_cached_routes(app.routes, 60)
+    return TestClient(app)
+
+
+def test_cache_hit_carries_cors_headers():
+    redis = FakeRedis()
+    client = _client(redis)
+
+    miss = client.get("/cached", headers={"Origin": ORIGIN})
+    assert redis.hashes, "first response should have been stored"
+    hit = client.get("/cached", headers={"Origin": ORIGIN})
+
+    assert hit.json() == miss.json() == {"ok": True}
+    for response in (miss, hit):
+        assert response.headers["access-control-allow-origin"] == ORIGIN
+        assert "Origin" in response.headers["vary"]
+
+
+def test_cache_hit_rejects_disallowed_origin_like_a_miss():
+    client = _client(FakeRedis())
+    client.get("/cached")
+    hit = client.get("/cached", headers={"Origin": "https://evil.example"})
+    assert "access-control-allow-origin" not in hit.headers
+
+
+def test_cache_hit_replays_handler_headers():
+    redis = FakeRedis()
+    client = _client(redis)
+
+    miss = client.get("/cached")
+    hit = client.get("/cached")
+
+    for name in ("cache-control", "etag", "x-catalog-version", "content-type"):
+        assert hit.headers[name] == miss.headers[name]
+    assert int(hit.headers["content-length"]) == len(hit.content)
+
+
+def test_vary_headers_are_part_of_the_cache_key():
+    client = _client(FakeRedis())
+
+    assert client.get("/per-lab", headers={"x-laboratory": "1"}).json() == {"lab": "1"}
+    assert client.get("/per-lab", headers={"x-laboratory": "2"}).json() == {"lab": "2"}
+    assert client.get("/per-lab", headers={"x-laboratory": "1"}).json() == {"lab": "1"}
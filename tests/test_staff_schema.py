@@ -0,0 +1,37 @@
+import pytest
+
+from app.schemas.staff_schema.staff_schema import StaffBase, StaffCreate
+
+
+@pytest.mark.parametrize("password", [
+    "Abcdefg1",
+    "abcdefG1",
+    "PASSWORd9",
+    "Ábcdefg1",   # only uppercase letter is non-ASCII
+    "ÀBCDEFGè1",  # only lowercase letter is non-ASCII
+    "Abcdefgh١",  # only digit is non-ASCII (Arabic-Indic one)
+])
+def test_password_accepts_all_three_classes(password):
+    assert StaffCreate.validate_password(password) == password
+
+
+@pytest.mark.parametrize("password", ["abcdefg1", "ABCDEFG1", "Abcdefgh", "12345678", "ábcdefg1", "Ábcdefgh"])
+def test_password_rejects_a_missing_class(password):
+    with pytest.raises(ValueError, match="uppercase, lowercase, and digit"):
+        StaffCreate.validate_password(password)
+
+
+def test_staff_id_canonical_input_is_returned_unchanged():
+    staff_id = "STF-AB12C3"
+    assert StaffBase.validate_staff_id(staff_id) is staff_id
+
+
+@pytest.mark.parametrize("raw", [" stf-ab12c3", "STF-AB12C3 ", "stf-AB12c3", "\tSTF-AB12C3\n"])
+def test_staff_id_is_normalised(raw):
+    assert StaffBase.validate_staff_id(raw) == "STF-AB12C3"
+
+
+@pytest.mark.parametrize("raw", ["STF-AB12C", "STF-AB12C34", "ST-AB12C3", "STF-ÀB12C3", "STF_AB12C3"])
+def test_staff_id_rejects_bad_format(raw):
+    with pytest.raises(ValueError, match="STF-XXXXXX"):
+        StaffBase.validate_staff_id(raw)
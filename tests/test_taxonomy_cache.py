@@ -0,0 +1,37 @@
+from types import SimpleNamespace
+
+import pytest
+
+from app.core import request_memo as request_memo_module
+from app.services import taxonomy_cache
+
+
+@pytest.fixture(autouse=True)
+def request_scope():
+    """Stand in for RequestMemoMiddleware: one memo store for the test."""
+    token = request_memo_module._memo.set({})
+    yield
+    request_memo_module._memo.reset(token)
+
+
+def _department(name):
+    return SimpleNamespace(id=7, name=name, code="HAEM", description=None)
+
+
+def test_department_payload_is_validated_once_per_request():
+    first = taxonomy_cache.department_payload(_department("Haematology"))
+    assert taxonomy_cache.department_payload(_department("Renamed")) is first
+
+
+def test_forget_department_clears_the_payload_used_by_staff_responses():
+    taxonomy_cache.department_payload(_department("Haematology"))
+    taxonomy_cache.forget_department(7)
+    assert taxonomy_cache.department_payload(_department("Renamed")).name == "Renamed"
+
+
+def test_forget_specialization_clears_the_payload_used_by_staff_responses():
+    specialization = SimpleNamespace(id=3, name="Phlebotomy", code=None, description=None)
+    taxonomy_cache.specialization_payload(specialization)
+    taxonomy_cache.forget_specialization(3)
+    specialization.name = "Venepuncture"
+    assert taxonomy_cache.specialization_payload(specialization).name == "Venepuncture"
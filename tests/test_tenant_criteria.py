@@ -0,0 +1,64 @@
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+
+from app import models
+from app.db.session import set_tenant
+
+pytestmark = pytest.mark.anyio
+
+LAB, OTHER_LAB = 1, 2
+
+
+@pytest.fixture
+async def priced_test_id(db) -> int:
+    category = models.TestCategory(name="Chemistry", code="CHEM")
+    db.add(category)
+    await db.flush()
+    test = models.Test(category_id=category.id, name="Glucose", code="GLU", specimen_type="blood_plasma")
+    db.add(test)
+    await db.flush()
+    db.add_all([
+        models.TestPrice(laboratory_id=lab, test_id=test.id, price_type="standard", base_price_cents=cents)
+        for lab, cents in ((LAB, 2500), (OTHER_LAB, 3000))
+    ])
+    db.add_all([
+        models.DiscountTier(laboratory_id=lab, name=f"Tier {lab}", minimum_amount_cents=50000, discount_bps=1000)
+        for lab in (LAB, OTHER_LAB)
+    ])
+    await db.commit()
+    return test.id
+
+
+async def test_selects_only_see_the_current_tenant(db, priced_test_id):
+    set_tenant(db, LAB)
+
+    prices = (await db.scalars(select(models.TestPrice))).all()
+    tiers = (await db.scalars(select(models.DiscountTier))).all()
+
+    assert {p.laboratory_id for p in prices} == {LAB}
+    assert {t.laboratory_id for t in tiers} == {LAB}
+
+
+async def test_relationship_loads_are_tenant_scoped(db, priced_test_id):
+    db.expunge_all()
+    set_tenant(db, OTHER_LAB)
+
+    test = await db.scalar(
+        select(models.Test).where(models.Test.id == priced_test_id).options(selectinload(models.Test.prices))
+    )
+
+    assert [p.base_price_cents for p in test.prices] == [3000]
+
+
+async def test_all_tenants_bypasses_the_filter(db, priced_test_id):
+    set_tenant(db, LAB)
+
+    prices = (await db.scalars(select(models.TestPrice).execution_options(all_tenants=True))).all()
+
+    assert {p.laboratory_id for p in prices} == {LAB, OTHER_LAB}
+
+
+async def test_no_tenant_no_filter(db, priced_test_id):
+    prices = (await db.scalars(select(models.TestPrice))).all()
+    assert len(prices) == 2